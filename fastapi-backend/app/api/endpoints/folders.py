@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Dict, Any, List
 
@@ -34,14 +36,16 @@ async def create_class_folders(
                 detail="User ID in request does not match authenticated user"
             )
 
-        # Initialize Google Service
-        google_service = DocsService(user_id=request.user_id)
+        # Initialize Google Service; the constructor reads credentials
+        # from Firebase and builds API clients, so keep it (and the other
+        # blocking Google calls below) off the event loop
+        google_service = await asyncio.to_thread(DocsService, request.user_id)
 
         # Check if user has valid Google credentials
-        if not google_service.has_valid_credentials():
+        if not await asyncio.to_thread(google_service.has_valid_credentials):
             # Get authorization URL for Google OAuth
             auth_service = google_service.auth_service
-            auth_result = auth_service.initialize_auth_for_registration(request.user_id)
+            auth_result = await auth_service.initialize_auth_for_registration_async(request.user_id)
 
             if auth_result.get("status") == "url_generated" and auth_result.get("auth_url"):
                 raise HTTPException(
@@ -59,9 +63,9 @@ async def create_class_folders(
                 )
 
         # Create semester folders for the classes
-        result = google_service.create_semester_folders(
-            class_names=request.class_names,
-            parent_folder_id=request.parent_folder_id
+        result = await google_service.drive_service_impl.create_semester_folders_async(
+            request.class_names,
+            request.parent_folder_id
         )
 
         if result:
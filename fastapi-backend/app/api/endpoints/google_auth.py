@@ -42,8 +42,8 @@ async def get_google_auth_url(
         # Initialize GoogleAuthService
         auth_service = GoogleAuthService(user_id=request.user_id)
 
-        # Get authorization URL
-        auth_result = auth_service.initialize_auth_for_registration(request.user_id)
+        # Get authorization URL without blocking the event loop
+        auth_result = await auth_service.initialize_auth_for_registration_async(request.user_id)
 
         if auth_result.get("status") == "url_generated" and auth_result.get("auth_url"):
             return GoogleAuthUrlResponse(
@@ -245,8 +245,8 @@ async def handle_google_auth_callback(
         # Initialize GoogleAuthService
         auth_service = GoogleAuthService(user_id=request.user_id)
 
-        # Handle the authorization callback
-        auth_result = auth_service.initialize_auth_for_registration(
+        # Handle the authorization callback without blocking the event loop
+        auth_result = await auth_service.initialize_auth_for_registration_async(
             request.user_id,
             auth_code=request.auth_code
         )
@@ -0,0 +1,37 @@
+import logging
+import sys
+
+# Whether the shared handler has been attached to the application root logger
+_configured = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger wired to the shared application logging configuration.
+
+    The first call attaches a stream handler with a structured format to
+    the application root logger; subsequent calls are cheap lookups.
+    Loggers format lazily, so callers should pass format arguments
+    separately (e.g. logger.info("user %s", user_id)) to avoid building
+    log strings on paths where the record is filtered out.
+
+    Args:
+        name: Logger name, normally the module's __name__
+
+    Returns:
+        The configured logger
+    """
+    global _configured
+
+    if not _configured:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s %(message)s"
+        ))
+        app_logger = logging.getLogger("app")
+        app_logger.addHandler(handler)
+        app_logger.setLevel(logging.INFO)
+        app_logger.propagate = False
+        _configured = True
+
+    return logging.getLogger(name)
@@ -1,4 +1,5 @@
 from typing import Dict, List, Any, Optional
+import asyncio
 import requests
 from canvasapi import Canvas
 import json
@@ -65,7 +66,8 @@ class CanvasService:
             }
 
             print(f"Requesting Canvas credentials from: {url} for user ID: {user_id}")
-            response = requests.get(url, headers=headers)
+            # Run the blocking HTTP request off the event loop
+            response = await asyncio.to_thread(requests.get, url, headers=headers)
 
             if response.status_code == 401:
                 print(f"Authentication failed when getting Canvas credentials. Status code: 401")
@@ -134,20 +136,22 @@ class CanvasService:
                 print("Canvas client is not initialized")
                 return []
 
-            # Get current user
+            # Get current user (canvasapi is blocking, so run it off the event loop)
             try:
                 print("Getting current Canvas user")
-                user = self.canvas.get_current_user()
+                user = await asyncio.to_thread(self.canvas.get_current_user)
                 print(f"Current Canvas user: {user.name} (ID: {user.id})")
             except Exception as e:
                 print(f"Error getting current Canvas user: {str(e)}")
                 return []
 
-            # Get courses
+            # Get courses (materialize the paginated list in a worker thread)
             try:
                 print("Getting Canvas courses")
-                courses = user.get_courses(include=["term", "teachers"])
-                print(f"Retrieved {len(list(courses))} courses")
+                courses = await asyncio.to_thread(
+                    lambda: list(user.get_courses(include=["term", "teachers"]))
+                )
+                print(f"Retrieved {len(courses)} courses")
             except Exception as e:
                 print(f"Error getting Canvas courses: {str(e)}")
                 return []
@@ -189,20 +193,22 @@ class CanvasService:
             print(f"Error getting courses: {str(e)}")
             return []
 
-    async def get_courses_from_firestore(self, user_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def get_courses_from_firestore(self, user_id: str, status: Optional[str] = None,
+                                         fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get courses for a user directly from Firestore.
 
         Args:
             user_id: Firebase user ID
             status: Optional status filter ('current' or 'past')
+            fields: Optional projection of course fields to return
 
         Returns:
             List of courses from Firestore
         """
         try:
             print(f"Getting courses from Firestore for user ID: {user_id}")
-            courses = await self.firestore_service.get_user_courses(user_id, status)
+            courses = await self.firestore_service.get_user_courses(user_id, status, fields)
 
             if not courses:
                 print(f"No courses found in Firestore for user {user_id}")
@@ -1,4 +1,6 @@
 from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
 import uuid
 import requests
 import json
@@ -12,6 +14,11 @@ from app.tools.canvas_tool import CanvasTool
 # In a production environment, this should be replaced with a database
 conversation_history: Dict[str, List[Dict[str, str]]] = {}
 
+# In-flight Gemini requests keyed by payload hash, so identical concurrent
+# requests (e.g. a double-clicked send) share a single API call.
+# Module-level because ChatService is instantiated per request.
+_inflight_requests: Dict[str, "asyncio.Future[str]"] = {}
+
 class ChatService:
     """Service for handling chat interactions with Gemini."""
 
@@ -165,6 +172,54 @@ class ChatService:
             print(f"Error calling Gemini API: {str(e)}")
             return "I'm sorry, I encountered an error while processing your request. Please try again later."
 
+    async def _call_gemini_api_coalesced(self, message: str, conversation_history: List[Dict[str, str]]) -> str:
+        """
+        Call the Gemini API, deduplicating identical in-flight requests.
+
+        If an identical request (same message and history) is already in
+        flight, await its result instead of issuing a second API call.
+
+        Args:
+            message: The user's message
+            conversation_history: The conversation history
+
+        Returns:
+            The AI's response
+        """
+        key = hashlib.blake2b(
+            json.dumps(
+                {"message": message, "history": conversation_history},
+                sort_keys=True
+            ).encode(),
+            digest_size=16
+        ).hexdigest()
+
+        # If the same request is already in flight, share its result
+        inflight = _inflight_requests.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future: "asyncio.Future[str]" = asyncio.get_event_loop().create_future()
+        _inflight_requests[key] = future
+
+        try:
+            # Run the blocking API call off the event loop so duplicate
+            # requests can actually arrive while this one is in flight
+            response = await asyncio.to_thread(self._call_gemini_api, message, conversation_history)
+            if not future.done():
+                future.set_result(response)
+            return response
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        finally:
+            # If this task was cancelled before resolving the future,
+            # cancel it too so coalesced waiters are not left hanging
+            if not future.done():
+                future.cancel()
+            _inflight_requests.pop(key, None)
+
     def _is_identity_question(self, message: str) -> bool:
         """
         Check if the message is asking about the AI's identity or name.
@@ -239,7 +294,7 @@ class ChatService:
                     ai_response = canvas_response
                 else:
                     # Call the Gemini API for non-Canvas queries
-                    ai_response = self._call_gemini_api(message, messages)
+                    ai_response = await self._call_gemini_api_coalesced(message, messages)
 
             # Add the AI response to history
             messages.append({"role": "assistant", "content": ai_response})
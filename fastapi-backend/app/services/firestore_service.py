@@ -1,7 +1,92 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
+import random
+import time
 import firebase_admin
 from firebase_admin import firestore
 from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Retry policy for Firestore round trips. Only transient RPC errors
+# (unavailable, deadline exceeded, etc.) are retried, with exponential
+# backoff plus jitter; anything else propagates immediately so real bugs
+# and cancellations are not masked by retries.
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY_SECONDS = 0.5
+
+try:
+    from google.api_core import exceptions as gapi_exceptions
+    _RETRYABLE_EXCEPTIONS = (
+        gapi_exceptions.ServiceUnavailable,
+        gapi_exceptions.DeadlineExceeded,
+        gapi_exceptions.InternalServerError,
+        gapi_exceptions.ResourceExhausted,
+        gapi_exceptions.Aborted
+    )
+except ImportError:  # pragma: no cover - google-api-core ships with firebase-admin
+    _RETRYABLE_EXCEPTIONS = ()
+
+
+async def _call_with_retries(call, description: str):
+    """
+    Run a blocking Firestore call in a worker thread with retries.
+
+    Args:
+        call: Zero-argument callable performing the Firestore RPC
+        description: Short description of the call, used in retry logs
+
+    Returns:
+        The result of the call
+
+    Raises:
+        The last exception if all attempts fail
+    """
+    delay = _RETRY_BASE_DELAY_SECONDS
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            return await asyncio.to_thread(call)
+        except _RETRYABLE_EXCEPTIONS as e:
+            if attempt == _RETRY_ATTEMPTS - 1:
+                raise
+            logger.warning("Retrying %s after error (attempt %d/%d): %s", description, attempt + 1, _RETRY_ATTEMPTS, e)
+            await asyncio.sleep(delay + random.uniform(0, delay))
+            delay *= 2
+
+# Canvas credentials rarely change, so cache them per user with a TTL to
+# avoid a Firestore round trip on every request. Module-level because
+# FirestoreService is instantiated per service.
+_CANVAS_CREDENTIALS_TTL_SECONDS = 300
+_canvas_credentials_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+# One Firestore client per process. The Python Admin SDK has no preferRest
+# equivalent (that is a Node.js option), so the way to keep single-document
+# lookups fast here is to establish the gRPC channel once and keep it warm
+# instead of paying connection setup per service instance.
+_shared_db = None
+
+
+def get_firestore_client():
+    """
+    Get the shared Firestore client for this process.
+
+    Returns:
+        The Firestore client, or None if Firebase is not initialized
+    """
+    global _shared_db
+
+    if _shared_db is None:
+        try:
+            if firebase_admin._apps:
+                _shared_db = firestore.client()
+                logger.info("Firestore client initialized successfully")
+            else:
+                logger.warning("Firebase Admin SDK not initialized. Cannot create Firestore client.")
+        except Exception as e:
+            logger.error("Error initializing Firestore client: %s", e)
+
+    return _shared_db
 
 
 class FirestoreService:
@@ -14,16 +99,9 @@ class FirestoreService:
 
     def _initialize_firestore(self):
         """Initialize Firestore client."""
-        try:
-            # Get Firestore instance
-            if firebase_admin._apps:
-                self.db = firestore.client()
-                print("Firestore client initialized successfully")
-            else:
-                print("Firebase Admin SDK not initialized. Cannot create Firestore client.")
-        except Exception as e:
-            print(f"Error initializing Firestore client: {str(e)}")
-            self.db = None
+        # Reuse the shared per-process client so every service instance
+        # talks over the same warm channel
+        self.db = get_firestore_client()
 
     async def get_canvas_credentials(self, user_id: str) -> Dict[str, str]:
         """
@@ -37,74 +115,276 @@ class FirestoreService:
         """
         try:
             if not self.db:
-                print("Firestore client not initialized")
+                logger.warning("Firestore client not initialized")
                 return {}
 
             # Skip for test user when auth is disabled
             if settings.FIREBASE_AUTH_DISABLED and user_id == "test-user":
-                print("Using mock Canvas credentials for test user")
+                logger.debug("Using mock Canvas credentials for test user")
                 return {
                     "canvas_url": "https://canvas.instructure.com",
                     "api_key": "test_api_key"
                 }
 
-            # Get user document from Firestore
+            # Return cached credentials if they are still fresh
+            cached = _canvas_credentials_cache.get(user_id)
+            if cached and time.monotonic() - cached[0] < _CANVAS_CREDENTIALS_TTL_SECONDS:
+                return cached[1]
+
+            # Get only the credentials field from the user document
+            # (off the event loop) instead of the full payload
             user_ref = self.db.collection('users').document(user_id)
-            user_doc = user_ref.get()
+            user_doc = await _call_with_retries(
+                lambda: user_ref.get(field_paths=['canvasCredentials']),
+                f"canvas credentials read for user {user_id}"
+            )
 
             if not user_doc.exists:
-                print(f"User {user_id} not found in Firestore")
+                logger.info("User %s not found in Firestore", user_id)
                 return {}
 
             # Get Canvas credentials from user document
             user_data = user_doc.to_dict()
             if not user_data.get('canvasCredentials'):
-                print(f"Canvas credentials not found for user {user_id}")
+                logger.info("Canvas credentials not found for user %s", user_id)
                 return {}
 
-            # Return Canvas credentials
-            return {
+            # Cache and return Canvas credentials
+            credentials = {
                 "canvas_url": user_data['canvasCredentials'].get('url'),
                 "api_key": user_data['canvasCredentials'].get('apiKey')
             }
+            _canvas_credentials_cache[user_id] = (time.monotonic(), credentials)
+            return credentials
         except Exception as e:
-            print(f"Error getting Canvas credentials from Firestore: {str(e)}")
+            logger.error("Error getting Canvas credentials from Firestore: %s", e)
             return {}
 
-    async def get_user_courses(self, user_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def store_canvas_credentials(self, user_id: str, canvas_url: str, api_key: str) -> bool:
+        """
+        Store Canvas credentials for a user in Firestore.
+
+        The credential fields and the update timestamp are committed in a
+        single batched write, and the credentials cache is updated in place
+        so the next read does not go back to Firestore.
+
+        Args:
+            user_id: The Firebase user ID
+            canvas_url: The URL of the user's Canvas instance
+            api_key: The user's Canvas API key
+
+        Returns:
+            True if the credentials were stored successfully
+        """
+        try:
+            if not self.db:
+                logger.warning("Firestore client not initialized")
+                return False
+
+            user_ref = self.db.collection('users').document(user_id)
+
+            # Commit all fields in one batched write
+            batch = self.db.batch()
+            batch.set(user_ref, {
+                'canvasCredentials': {
+                    'url': canvas_url,
+                    'apiKey': api_key,
+                    'updatedAt': firestore.SERVER_TIMESTAMP
+                }
+            }, merge=True)
+            # Safe to retry: the batch is a plain overwrite of the same fields
+            await _call_with_retries(
+                batch.commit, f"canvas credentials write for user {user_id}"
+            )
+
+            # Write through to the cache so the next read is served locally
+            _canvas_credentials_cache[user_id] = (time.monotonic(), {
+                "canvas_url": canvas_url,
+                "api_key": api_key
+            })
+            return True
+        except Exception as e:
+            logger.error("Error storing Canvas credentials in Firestore: %s", e)
+            return False
+
+    def invalidate_canvas_credentials(self, user_id: str):
+        """
+        Drop cached Canvas credentials for a user.
+
+        Call this after the user updates their credentials so the next
+        read goes back to Firestore.
+
+        Args:
+            user_id: The Firebase user ID
+        """
+        _canvas_credentials_cache.pop(user_id, None)
+
+    async def get_user_courses(self, user_id: str, status: Optional[str] = None,
+                               fields: Optional[List[str]] = None,
+                               limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get user's courses from Firestore.
 
         Args:
             user_id: The Firebase user ID
             status: Optional status filter ('current' or 'past')
+            fields: Optional projection; when provided, Firestore returns
+                    only these fields instead of full course documents
+            limit: Optional maximum number of courses to return
 
         Returns:
             List of courses
         """
         try:
             if not self.db:
-                print("Firestore client not initialized")
+                logger.warning("Firestore client not initialized")
                 return []
 
             # Create query for user's courses
             courses_ref = self.db.collection('users').document(user_id).collection('courses')
-            
+
             # Apply status filter if provided
             if status:
                 query = courses_ref.where('status', '==', status)
             else:
                 query = courses_ref
-                
-            # Execute query
-            courses_snapshot = query.get()
-            
-            if not courses_snapshot:
-                print(f"No courses found for user {user_id}")
+
+            # Apply projection if provided to shrink the response payload
+            if fields:
+                query = query.select(fields)
+
+            # Cap the result set when the caller only needs the first N
+            # courses (backed by the courses status index)
+            if limit:
+                query = query.limit(limit)
+
+            # Execute the explicit subcollection query (off the event loop,
+            # with retries), streaming straight into the result list instead
+            # of materializing the snapshots first
+            courses = await _call_with_retries(
+                lambda: [doc.to_dict() for doc in query.stream()],
+                f"courses query for user {user_id}"
+            )
+
+            if not courses:
+                logger.info("No courses found for user %s", user_id)
+                return []
+
+            return courses
+        except Exception as e:
+            logger.error("Error getting courses from Firestore: %s", e)
+            return []
+
+    async def get_course_ids(self, user_id: str) -> List[str]:
+        """
+        Get the IDs of all of the user's courses from Firestore.
+
+        Uses a keys-only projection (select with no fields) so Firestore
+        returns just the document keys instead of full course payloads.
+
+        Args:
+            user_id: The Firebase user ID
+
+        Returns:
+            List of course document IDs
+        """
+        try:
+            if not self.db:
+                logger.warning("Firestore client not initialized")
+                return []
+
+            courses_ref = self.db.collection('users').document(user_id).collection('courses')
+            query = courses_ref.select([])
+
+            courses_snapshot = await _call_with_retries(
+                query.get, f"course ID query for user {user_id}"
+            )
+            return [doc.id for doc in courses_snapshot]
+        except Exception as e:
+            logger.error("Error getting course IDs from Firestore: %s", e)
+            return []
+
+    async def get_courses_batch(self, user_id: str, course_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get a known set of course documents in a single batched read.
+
+        Uses Firestore get_all() so the documents resolve in one network
+        round trip instead of one request per document.
+
+        Args:
+            user_id: The Firebase user ID
+            course_ids: Course document IDs to fetch
+
+        Returns:
+            List of courses that exist
+        """
+        try:
+            if not self.db:
+                logger.warning("Firestore client not initialized")
+                return []
+
+            if not course_ids:
                 return []
-                
-            # Convert to list of dictionaries
-            return [doc.to_dict() for doc in courses_snapshot]
+
+            courses_ref = self.db.collection('users').document(user_id).collection('courses')
+            refs = [courses_ref.document(str(course_id)) for course_id in course_ids]
+
+            snapshots = await _call_with_retries(
+                lambda: list(self.db.get_all(refs)),
+                f"batched course read for user {user_id}"
+            )
+            return [doc.to_dict() for doc in snapshots if doc.exists]
         except Exception as e:
-            print(f"Error getting courses from Firestore: {str(e)}")
+            logger.error("Error batch-reading courses from Firestore: %s", e)
             return []
+
+    async def get_current_courses(self, user_id: str,
+                                  fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get the user's current courses from Firestore.
+
+        Args:
+            user_id: The Firebase user ID
+            fields: Optional projection of course fields to return
+
+        Returns:
+            List of current courses
+        """
+        return await self.get_user_courses(user_id, "current", fields)
+
+    async def get_all_courses(self, user_id: str,
+                              fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get all of the user's courses from Firestore.
+
+        Args:
+            user_id: The Firebase user ID
+            fields: Optional projection of course fields to return
+
+        Returns:
+            List of all courses
+        """
+        return await self.get_user_courses(user_id, fields=fields)
+
+    async def get_courses_bundle(self, user_id: str,
+                                 fields: Optional[List[str]] = None) -> Tuple[Dict[str, str], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get Canvas credentials, current courses and all courses concurrently.
+
+        The three Firestore reads are independent and network-bound, so
+        running them under asyncio.gather drops the wall time from the sum
+        of the round trips to roughly the slowest one.
+
+        Args:
+            user_id: The Firebase user ID
+            fields: Optional projection of course fields to return
+
+        Returns:
+            Tuple of (canvas credentials, current courses, all courses)
+        """
+        credentials, current_courses, all_courses = await asyncio.gather(
+            self.get_canvas_credentials(user_id),
+            self.get_current_courses(user_id, fields),
+            self.get_all_courses(user_id, fields)
+        )
+        return credentials, current_courses, all_courses
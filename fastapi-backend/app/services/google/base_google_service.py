@@ -1,22 +1,158 @@
 # Standard library imports
 import os
 import json
+import time
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 
 # Third-party imports
 from dotenv import load_dotenv
-from firebase_admin import db
+import firebase_admin
+from firebase_admin import db, firestore
+
+# Local imports
+from app.services.firestore_service import get_firestore_client
 
 # Google API imports
 from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
+from requests.adapters import HTTPAdapter
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 
 # Load environment variables
 load_dotenv()
 
+# orjson parses large credential blobs noticeably faster than the stdlib;
+# fall back to json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed GOOGLE_CREDENTIALS_JSON, cached per process. The environment
+# variable does not change at runtime, so there is no reason to re-read
+# and re-parse it on every credential lookup.
+_client_config_cache: Optional[Dict] = None
+
+# Per-user cache of loaded credentials. DocsService constructs several
+# specialized services per request; without this each of them re-reads
+# Firebase. Entries carry a timestamp and are evicted after the TTL so
+# credentials for inactive users do not accumulate for the lifetime of
+# the process. Built discovery clients are deliberately NOT cached
+# across instances: each client embeds a single httplib2 transport,
+# which is not thread safe, so sharing one between concurrent requests
+# for the same user could corrupt responses. With static discovery a
+# per-instance build is just a local parse — no network round trip.
+_USER_CACHE_TTL_SECONDS = 3600
+_credentials_cache: Dict[str, tuple] = {}
+
+# Per-user AuthorizedSession objects for raw HTTP calls (media export,
+# download, etc.). requests keeps the underlying TCP connections alive and
+# pools them, so reusing one session per user avoids a TLS handshake per
+# call. (The Google API stack here has no HTTP/2 transport; connection
+# reuse over HTTP/1.1 keep-alive is the available win.)
+_sessions_cache: Dict[str, tuple] = {}
+
+
+def _cache_get(cache: Dict[str, tuple], user_id: str):
+    """
+    Get a fresh entry from a per-user cache, evicting it if expired.
+
+    Args:
+        cache: One of the per-user caches
+        user_id: The Firebase user ID
+
+    Returns:
+        The cached value or None if missing or expired
+    """
+    entry = cache.get(user_id)
+    if entry is None:
+        return None
+
+    timestamp, value = entry
+    if time.monotonic() - timestamp >= _USER_CACHE_TTL_SECONDS:
+        cache.pop(user_id, None)
+        return None
+
+    return value
+
+# Short-lived cache of credential validity per user, so repeated
+# has_valid_credentials checks within a request burst do not each hit
+# Firebase when no credentials are cached yet.
+_VALID_CREDENTIALS_TTL_SECONDS = 60
+_valid_credentials_cache: Dict[str, tuple] = {}
+
+# Fields a stored token must have before we try to build a Credentials
+# object, and attributes a Credentials object must have before we save it.
+# Hoisted to module level so the save/load paths do not rebuild them.
+_REQUIRED_TOKEN_FIELDS = ('token', 'refresh_token', 'token_uri')
+_REQUIRED_CREDENTIAL_ATTRS = ('token', 'refresh_token', 'token_uri', 'client_id', 'client_secret', 'scopes')
+
+
+class _FastJsonModel(JsonModel):
+    """
+    JSON request/response model that uses orjson when available.
+
+    googleapiclient serializes every request body (e.g. the large Docs
+    batchUpdate payloads) with stdlib json; routing the (de)serialization
+    through orjson cuts the CPU spent on that step. The model is the
+    supported hook for this — it is passed to discovery.build, so no
+    monkey-patching of the client library is needed.
+    """
+
+    def serialize(self, body_value):
+        if orjson is None:
+            return super().serialize(body_value)
+        try:
+            return orjson.dumps(body_value).decode('utf-8')
+        except TypeError:
+            # Fall back for payloads orjson cannot encode
+            return super().serialize(body_value)
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+        body = orjson.loads(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def _get_client_config() -> Optional[Dict]:
+    """
+    Get the parsed GOOGLE_CREDENTIALS_JSON client configuration.
+
+    The JSON is parsed once and cached for the lifetime of the process.
+
+    Returns:
+        Optional[Dict]: Parsed credentials dictionary or None if unset/invalid
+    """
+    global _client_config_cache
+
+    if _client_config_cache is not None:
+        return _client_config_cache
+
+    google_creds_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
+    if not google_creds_json:
+        print("Error: GOOGLE_CREDENTIALS_JSON environment variable not set")
+        return None
+
+    try:
+        if orjson is not None:
+            _client_config_cache = orjson.loads(google_creds_json)
+        else:
+            _client_config_cache = json.loads(google_creds_json)
+    except Exception as e:
+        print(f"Error parsing GOOGLE_CREDENTIALS_JSON: {str(e)}")
+        return None
+
+    return _client_config_cache
+
+
 class BaseGoogleService:
     """
     Base service for interacting with Google APIs.
@@ -33,6 +169,9 @@ class BaseGoogleService:
         'https://www.googleapis.com/auth/presentations'
     ]
 
+    # Precomputed set form of SCOPES for the stored-scope diff
+    REQUIRED_SCOPES = frozenset(SCOPES)
+
     def __init__(self, user_id=None):
         """
         Initialize the BaseGoogleService with user credentials
@@ -57,11 +196,68 @@ class BaseGoogleService:
 
     def _initialize_services(self):
         """Initialize all Google API services with the current credentials"""
-        if self.credentials:
-            self.docs_service = build('docs', 'v1', credentials=self.credentials)
-            self.drive_service = build('drive', 'v3', credentials=self.credentials)
-            self.sheets_service = build('sheets', 'v4', credentials=self.credentials)
-            self.slides_service = build('slides', 'v1', credentials=self.credentials)
+        if not self.credentials:
+            return
+
+        # Build the clients per instance so their embedded transports
+        # are never shared across concurrent requests (httplib2 is not
+        # thread safe); static_discovery serves the bundled discovery
+        # documents, so this never fetches discovery JSON over the
+        # network
+        model = _FastJsonModel(data_wrapper=False)
+        self.docs_service = build('docs', 'v1', credentials=self.credentials, model=model,
+                                  static_discovery=True, cache_discovery=False)
+        self.drive_service = build('drive', 'v3', credentials=self.credentials, model=model,
+                                   static_discovery=True, cache_discovery=False)
+        self.sheets_service = build('sheets', 'v4', credentials=self.credentials, model=model,
+                                    static_discovery=True, cache_discovery=False)
+        self.slides_service = build('slides', 'v1', credentials=self.credentials, model=model,
+                                    static_discovery=True, cache_discovery=False)
+
+    def get_authorized_session(self):
+        """
+        Get a pooled AuthorizedSession for raw Google HTTP calls.
+
+        The session carries the user's credentials and reuses keep-alive
+        connections across calls, so callers that hit Google endpoints
+        directly (media export/download) skip per-call connection setup.
+
+        Returns:
+            AuthorizedSession: Session bound to this user's credentials,
+            or None if no credentials are available
+        """
+        if not self.credentials:
+            return None
+
+        session = _cache_get(_sessions_cache, self.user_id) if self.user_id else None
+
+        if session is None:
+            session = AuthorizedSession(self.credentials)
+            # Widen the connection pool beyond requests' default of 10
+            # so gathered calls from worker threads do not queue on (or
+            # discard) pooled connections
+            session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=50))
+            if self.user_id:
+                _sessions_cache[self.user_id] = (time.monotonic(), session)
+
+        return session
+
+    def _fresh_authorized_http(self):
+        """
+        Build a per-call authorized httplib2 transport.
+
+        The discovery clients are cached per user and their embedded
+        httplib2 connection is not thread safe, so methods that may run
+        concurrently in worker threads pass one of these to execute()
+        instead of sharing the client's transport.
+
+        Returns:
+            AuthorizedHttp: Transport bound to this user's credentials,
+            or None if no credentials are available
+        """
+        if not self.credentials:
+            return None
+        return AuthorizedHttp(self.credentials, http=build_http())
 
     def has_valid_credentials(self):
         """
@@ -74,14 +270,20 @@ class BaseGoogleService:
             if not self.user_id:
                 return False
 
-            # Try to get credentials
-            creds = self._get_credentials_from_firebase()
+            # Serve recent validity checks from the cache
+            cached = _valid_credentials_cache.get(self.user_id)
+            if cached and time.monotonic() - cached[0] < _VALID_CREDENTIALS_TTL_SECONDS:
+                return cached[1]
 
-            # Check if credentials exist and are valid
-            if creds and creds.valid:
-                return True
+            # Try to get credentials through the cached path so the check
+            # shares one Firebase read with service initialization instead
+            # of issuing its own
+            creds = self._get_credentials()
 
-            return False
+            # Check if credentials exist and are valid
+            is_valid = bool(creds and creds.valid)
+            _valid_credentials_cache[self.user_id] = (time.monotonic(), is_valid)
+            return is_valid
         except Exception as e:
             print(f"Error checking credentials validity: {str(e)}")
             return False
@@ -97,42 +299,41 @@ class BaseGoogleService:
             return None
 
         try:
+            # Reuse already-loaded credentials for this user if still valid
+            cached_creds = _cache_get(_credentials_cache, self.user_id)
+            if cached_creds and cached_creds.valid:
+                return cached_creds
+
             # First try to get credentials from Firebase
             creds = self._get_credentials_from_firebase()
             if creds:
+                _credentials_cache[self.user_id] = (time.monotonic(), creds)
                 return creds
 
             # If not in Firebase, try to get from environment (for development/testing)
-            google_creds_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
-            if not google_creds_json:
-                print("Error: GOOGLE_CREDENTIALS_JSON environment variable not set")
+            creds_dict = _get_client_config()
+            if creds_dict is None:
                 return None
 
-            try:
-                creds_dict = json.loads(google_creds_json)
-
-                # Check if this is a web application or installed application credentials
-                if 'web' in creds_dict:
-                    # Web application credentials - we can't directly create user credentials
-                    # from these, but we can use them for the OAuth flow
-                    print("Web application credentials found. User needs to go through OAuth flow.")
-                    return None
-                elif 'installed' in creds_dict:
-                    # Installed application credentials
-                    client_config = creds_dict['installed']
-                    # We still need a refresh token, which comes from the OAuth flow
-                    print("Installed application credentials found. User needs to go through OAuth flow.")
-                    return None
-                else:
-                    # Try to use as authorized user credentials
-                    creds = Credentials.from_authorized_user_info(creds_dict)
-
-                    # Save credentials to Firebase for future use
-                    self._save_credentials_to_firebase(creds)
-                    return creds
-            except Exception as format_error:
-                print(f"Error parsing GOOGLE_CREDENTIALS_JSON: {str(format_error)}")
+            # Check if this is a web application or installed application credentials
+            if 'web' in creds_dict:
+                # Web application credentials - we can't directly create user credentials
+                # from these, but we can use them for the OAuth flow
+                print("Web application credentials found. User needs to go through OAuth flow.")
+                return None
+            elif 'installed' in creds_dict:
+                # Installed application credentials
+                # We still need a refresh token, which comes from the OAuth flow
+                print("Installed application credentials found. User needs to go through OAuth flow.")
                 return None
+            else:
+                # Try to use as authorized user credentials
+                creds = Credentials.from_authorized_user_info(creds_dict)
+
+                # Save credentials to Firebase for future use
+                self._save_credentials_to_firebase(creds)
+                _credentials_cache[self.user_id] = (time.monotonic(), creds)
+                return creds
 
         except Exception as e:
             print(f"Error getting credentials: {str(e)}")
@@ -149,14 +350,11 @@ class BaseGoogleService:
             return None
 
         try:
-            # Load credentials from settings string
-            google_creds_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
-            if not google_creds_json:
-                print("Error: GOOGLE_CREDENTIALS_JSON environment variable not set")
+            # Load the cached client configuration
+            credentials_dict = _get_client_config()
+            if credentials_dict is None:
                 return None
 
-            credentials_dict = json.loads(google_creds_json)
-
             # Determine if we have web or installed application credentials
             client_type = None
             client_config = None
@@ -172,14 +370,36 @@ class BaseGoogleService:
                 print("Error: Invalid GOOGLE_CREDENTIALS_JSON format - missing web or installed section")
                 return None
 
-            # Get token data from Firebase
+            # Get token data from Firestore, falling back to the legacy
+            # Realtime Database location
+            token_data = None
             try:
-                user_ref = db.reference(f'users/{self.user_id}/google_credentials')
-                token_data = user_ref.get()
+                fs_db = get_firestore_client()
+                if fs_db:
+                    snapshot = fs_db.collection('users').document(self.user_id).get(
+                        field_paths=['googleCredentials']
+                    )
+                    if snapshot.exists:
+                        token_data = (snapshot.to_dict() or {}).get('googleCredentials')
             except Exception as db_error:
-                print(f"Error accessing Firebase database: {str(db_error)}")
-                print("Make sure FIREBASE_DATABASE_URL is set correctly in your environment variables")
-                return None
+                print(f"Error reading credentials from Firestore: {str(db_error)}")
+
+            if not token_data:
+                try:
+                    user_ref = db.reference(f'users/{self.user_id}/google_credentials')
+                    token_data = user_ref.get()
+
+                    # Migrate legacy credentials to Firestore on first use
+                    if token_data:
+                        fs_db = get_firestore_client()
+                        if fs_db:
+                            fs_db.collection('users').document(self.user_id).set(
+                                {'googleCredentials': token_data}, merge=True
+                            )
+                except Exception as db_error:
+                    print(f"Error accessing Firebase database: {str(db_error)}")
+                    print("Make sure FIREBASE_DATABASE_URL is set correctly in your environment variables")
+                    return None
 
             if not token_data:
                 print(f"No Google credentials found for user {self.user_id}")
@@ -187,10 +407,10 @@ class BaseGoogleService:
 
             print("\nStored scopes in Firebase:", token_data.get('scopes'))
 
-            # Check if we have all required scopes
-            required_scopes = set(self.SCOPES)
-            stored_scopes = set(token_data.get('scopes', []))
-            missing_scopes = required_scopes - stored_scopes
+            # Check if we have all required scopes. Credentials served from
+            # the per-user cache skip this entirely; the diff only runs when
+            # tokens are (re)loaded from Firebase.
+            missing_scopes = self.REQUIRED_SCOPES.difference(token_data.get('scopes', []))
 
             if missing_scopes:
                 print(f"Missing required scopes: {missing_scopes}")
@@ -198,8 +418,7 @@ class BaseGoogleService:
                 return None
 
             # Check for required fields
-            required_fields = ['token', 'refresh_token', 'token_uri']
-            missing_fields = [field for field in required_fields if not token_data.get(field)]
+            missing_fields = [field for field in _REQUIRED_TOKEN_FIELDS if not token_data.get(field)]
 
             if missing_fields:
                 print(f"Missing required credential fields: {missing_fields}")
@@ -252,13 +471,15 @@ class BaseGoogleService:
                 return False
 
             # Check if credentials object has all required attributes
-            required_attrs = ['token', 'refresh_token', 'token_uri', 'client_id', 'client_secret', 'scopes']
-            missing_attrs = [attr for attr in required_attrs if not hasattr(creds, attr) or getattr(creds, attr) is None]
+            missing_attrs = [attr for attr in _REQUIRED_CREDENTIAL_ATTRS if getattr(creds, attr, None) is None]
 
             if missing_attrs:
                 print(f"Cannot save credentials: Missing required attributes: {missing_attrs}")
                 return False
 
+            # Compute the timestamps once, then build the payload
+            expiry = getattr(creds, 'expiry', None)
+
             # Convert credentials to dictionary format
             token_data = {
                 'token': creds.token,
@@ -267,15 +488,33 @@ class BaseGoogleService:
                 'client_id': creds.client_id,
                 'client_secret': creds.client_secret,
                 'scopes': creds.scopes,
-                'expiry': creds.expiry.isoformat() if hasattr(creds, 'expiry') and creds.expiry else None,
+                'expiry': expiry.isoformat() if expiry else None,
                 'updated_at': datetime.now().isoformat()
             }
 
-            # Save to Firebase
+            # Save to Firestore, falling back to the legacy Realtime
+            # Database location if Firestore is unavailable
             try:
-                user_ref = db.reference(f'users/{self.user_id}/google_credentials')
-                user_ref.set(token_data)
+                fs_db = get_firestore_client()
+                if fs_db:
+                    fs_db.collection('users').document(self.user_id).set(
+                        {'googleCredentials': token_data}, merge=True
+                    )
+                else:
+                    user_ref = db.reference(f'users/{self.user_id}/google_credentials')
+                    user_ref.set(token_data)
                 print(f"Successfully saved credentials to Firebase for user {self.user_id}")
+
+                # Write the fresh credentials through to the per-user
+                # cache and drop service objects and sessions still
+                # bound to the old grant — after a re-auth they would
+                # otherwise be served for up to the cache TTL
+                now = time.monotonic()
+                _credentials_cache[self.user_id] = (now, creds)
+                _sessions_cache.pop(self.user_id, None)
+
+                # Freshly saved credentials are valid
+                _valid_credentials_cache[self.user_id] = (now, True)
                 return True
             except Exception as db_error:
                 print(f"Error accessing Firebase database: {str(db_error)}")
@@ -297,8 +536,26 @@ class BaseGoogleService:
             if not self.user_id:
                 return False
 
+            # Remove from Firestore and from the legacy Realtime Database
+            # location. A missing Firestore doc (NotFound) just means there
+            # is nothing to delete there; it must not block the legacy
+            # cleanup or the cache eviction below.
+            fs_db = get_firestore_client()
+            if fs_db:
+                try:
+                    fs_db.collection('users').document(self.user_id).update(
+                        {'googleCredentials': firestore.DELETE_FIELD}
+                    )
+                except Exception as fs_error:
+                    print(f"Error deleting credentials from Firestore: {str(fs_error)}")
+
             user_ref = db.reference(f'users/{self.user_id}/google_credentials')
             user_ref.delete()
+
+            # Drop any cached credentials and sessions for this user
+            _credentials_cache.pop(self.user_id, None)
+            _sessions_cache.pop(self.user_id, None)
+            _valid_credentials_cache.pop(self.user_id, None)
             return True
         except Exception as e:
             print(f"Error deleting token from Firebase: {str(e)}")
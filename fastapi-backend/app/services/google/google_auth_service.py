@@ -1,13 +1,66 @@
 # Standard library imports
+import asyncio
+import hashlib
 import os
-import json
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Tuple
 
 # Google API imports
 from google_auth_oauthlib.flow import Flow
 
 # Local imports
-from app.services.google.base_google_service import BaseGoogleService
+from app.core.logging import get_logger
+from app.services.google.base_google_service import BaseGoogleService, _get_client_config
+
+logger = get_logger(__name__)
+
+__all__ = ["GoogleAuthService"]
+
+# Redirect URI resolved once per process; it depends only on environment
+# variables and the DEBUG setting, none of which change at runtime.
+_redirect_uri_cache: Optional[str] = None
+
+# Authorization URLs memoized per (user, scope set). The URL only varies
+# with the client config and scopes, so regenerating a flow for every
+# request (e.g. retried registrations) is wasted work. Kept short-lived so
+# consent prompts stay fresh.
+_AUTH_URL_TTL_SECONDS = 600
+_auth_url_cache: Dict[Tuple, Tuple[float, str]] = {}
+
+# Token-exchange results memoized briefly per authorization code.
+# Authorization codes are single-use at Google's token endpoint, so a
+# duplicate callback (browser double-redirect, client retry) would fail
+# the second exchange; serving the cached credentials instead makes the
+# retry succeed locally. Keys are SHA-256 hashes so raw codes are never
+# held in memory, and entries expire quickly since codes are short-lived.
+_TOKEN_EXCHANGE_TTL_SECONDS = 60
+_token_exchange_cache: Dict[str, Tuple[float, object]] = {}
+
+
+def _get_redirect_uri() -> str:
+    """
+    Get the OAuth redirect URI, cached per process.
+
+    Returns:
+        str: The redirect URI to use for the OAuth flow
+    """
+    global _redirect_uri_cache
+
+    if _redirect_uri_cache is None:
+        # Get redirect URI from environment or use default
+        redirect_uri = os.getenv('GOOGLE_REDIRECT_URI', 'http://127.0.0.1:5000/google-auth-callback')
+
+        # Check if we're in development mode (DEBUG=True)
+        from app.core.config import settings
+        if settings.DEBUG:
+            # Use localhost redirect URI for development
+            redirect_uri = 'http://localhost:8000/api/v1/google/callback'
+            logger.debug("DEBUG mode detected, using development redirect URI: %s", redirect_uri)
+
+        _redirect_uri_cache = redirect_uri
+
+    return _redirect_uri_cache
+
 
 class GoogleAuthService(BaseGoogleService):
     """
@@ -60,6 +113,12 @@ class GoogleAuthService(BaseGoogleService):
             str: Authorization URL or None if an error occurs
         """
         try:
+            # Serve a recently generated URL for this user and scope set
+            cache_key = (self.user_id, self.REQUIRED_SCOPES)
+            cached = _auth_url_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < _AUTH_URL_TTL_SECONDS:
+                return cached[1]
+
             flow = self._create_auth_flow()
             if not flow:
                 return None
@@ -71,10 +130,10 @@ class GoogleAuthService(BaseGoogleService):
                 access_type='offline',
                 include_granted_scopes='true'
             )
-            print(f"Generated authorization URL with prompt=consent and access_type=offline")
+            _auth_url_cache[cache_key] = (time.monotonic(), auth_url)
             return auth_url
         except Exception as e:
-            print(f"Error getting authorization URL: {str(e)}")
+            logger.error("Error getting authorization URL: %s", e)
             return None
 
     def handle_auth_callback(self, code):
@@ -89,58 +148,96 @@ class GoogleAuthService(BaseGoogleService):
         """
         try:
             if not code:
-                print("Error: No authorization code provided")
-                return False
-
-            print(f"Starting auth callback with code: {code[:10]}...") # Only show first 10 chars for security
-
-            # Create OAuth flow
-            flow = self._create_auth_flow()
-            if not flow:
-                print("Failed to create OAuth flow")
-                return False
-
-            print(f"Created flow with redirect URI: {flow._redirect_uri}")
-
-            # Exchange authorization code for access token
-            try:
-                flow.fetch_token(code=code)
-                print("Successfully fetched token")
-            except Exception as token_error:
-                print(f"Error fetching token: {str(token_error)}")
-                print("This could be due to an invalid or expired authorization code, or a redirect URI mismatch")
+                logger.warning("No authorization code provided")
                 return False
 
-            # Get credentials from flow
-            credentials = flow.credentials
+            # Serve a duplicate callback for the same code from the cache;
+            # the code is single-use, so re-exchanging it would fail
+            code_key = hashlib.sha256(code.encode()).hexdigest()
+            cached = _token_exchange_cache.get(code_key)
+            if cached and time.monotonic() - cached[0] < _TOKEN_EXCHANGE_TTL_SECONDS:
+                credentials = cached[1]
+            else:
+                # Create OAuth flow
+                flow = self._create_auth_flow()
+                if not flow:
+                    logger.error("Failed to create OAuth flow")
+                    return False
+
+                # Exchange authorization code for access token
+                try:
+                    flow.fetch_token(code=code)
+                except Exception as token_error:
+                    logger.error("Error fetching token (invalid/expired code or redirect URI mismatch): %s", token_error)
+                    return False
+
+                # Get credentials from flow and remember the exchange result.
+                # Evict expired entries first: codes are single use, so
+                # stale keys are never looked up again and would otherwise
+                # keep their credentials alive for the life of the process
+                credentials = flow.credentials
+                now = time.monotonic()
+                for key, (cached_at, _) in list(_token_exchange_cache.items()):
+                    if now - cached_at >= _TOKEN_EXCHANGE_TTL_SECONDS:
+                        _token_exchange_cache.pop(key, None)
+                _token_exchange_cache[code_key] = (now, credentials)
 
             # Verify that we have all required fields
             required_attrs = ['token', 'refresh_token', 'token_uri', 'client_id', 'client_secret', 'scopes']
             missing_attrs = [attr for attr in required_attrs if not hasattr(credentials, attr) or getattr(credentials, attr) is None]
 
             if missing_attrs:
-                print(f"Error: Missing required credential attributes: {missing_attrs}")
+                logger.error("Missing required credential attributes: %s", missing_attrs)
                 if 'refresh_token' in missing_attrs:
-                    print("Missing refresh_token. Make sure you're using 'consent' prompt in the authorization URL")
+                    logger.error("Missing refresh_token. Make sure you're using 'consent' prompt in the authorization URL")
                 return False
 
             # Save credentials and reinitialize services
             saved = self._save_credentials_to_firebase(credentials)
-            print(f"Saved credentials to Firebase: {saved}")
 
             if not saved:
-                print("Failed to save credentials to Firebase")
+                logger.error("Failed to save credentials to Firebase")
                 return False
 
             self.credentials = credentials
             self._initialize_services()
-            print("Successfully initialized services")
+            logger.debug("Successfully initialized services for user %s", self.user_id)
 
             return True
         except Exception as e:
-            print(f"Error handling auth callback: {str(e)}")
+            logger.error("Error handling auth callback: %s", e)
             return False
 
+    async def handle_auth_callback_async(self, code):
+        """
+        Handle the OAuth callback without blocking the event loop.
+
+        The token exchange is a full network round trip to Google, so run
+        the blocking flow in a worker thread.
+
+        Args:
+            code (str): Authorization code from Google OAuth
+
+        Returns:
+            bool: True if authentication was successful, False otherwise
+        """
+        return await asyncio.to_thread(self.handle_auth_callback, code)
+
+    async def initialize_auth_for_registration_async(self, user_id, auth_code=None):
+        """
+        Async variant of initialize_auth_for_registration for use from
+        async route handlers; the blocking OAuth work runs in a worker
+        thread.
+
+        Args:
+            user_id (str): Firebase user ID
+            auth_code (str, optional): Authorization code from Google OAuth
+
+        Returns:
+            dict: Authentication result (same shape as the sync method)
+        """
+        return await asyncio.to_thread(self.initialize_auth_for_registration, user_id, auth_code)
+
     def _create_auth_flow(self):
         """
         Create a new OAuth flow with proper scopes
@@ -149,31 +246,12 @@ class GoogleAuthService(BaseGoogleService):
             Flow: Google OAuth flow object or None if an error occurs
         """
         try:
-            # Use credentials from environment variable
-            google_creds = os.getenv('GOOGLE_CREDENTIALS_JSON')
-            if not google_creds:
-                print("Error: GOOGLE_CREDENTIALS_JSON not found in environment variables")
+            # Use the per-process cached client configuration and redirect URI
+            creds_dict = _get_client_config()
+            if creds_dict is None:
                 return None
 
-            # Parse the JSON string into a dictionary
-            creds_dict = json.loads(google_creds)
-
-            # Get redirect URI from environment or use default
-            redirect_uri = os.getenv('GOOGLE_REDIRECT_URI', 'http://127.0.0.1:5000/google-auth-callback')
-            print(f"Redirect URI from environment: {redirect_uri}")
-
-            # Check if we're in development mode (DEBUG=True)
-            from app.core.config import settings
-            if settings.DEBUG:
-                # Use localhost redirect URI for development
-                redirect_uri = 'http://localhost:8000/api/v1/google/callback'
-                print(f"DEBUG mode detected, using development redirect URI: {redirect_uri}")
-
-            # Print the authorized redirect URIs from the credentials
-            if 'web' in creds_dict and 'redirect_uris' in creds_dict['web']:
-                print(f"Authorized redirect URIs in credentials: {creds_dict['web']['redirect_uris']}")
-            elif 'installed' in creds_dict and 'redirect_uris' in creds_dict['installed']:
-                print(f"Authorized redirect URIs in credentials: {creds_dict['installed']['redirect_uris']}")
+            redirect_uri = _get_redirect_uri()
 
             # Determine if we have web or installed application credentials
             if 'web' in creds_dict:
@@ -181,10 +259,10 @@ class GoogleAuthService(BaseGoogleService):
             elif 'installed' in creds_dict:
                 client_type = 'installed'
             else:
-                print("Error: Invalid GOOGLE_CREDENTIALS_JSON format - missing web or installed section")
+                logger.error("Invalid GOOGLE_CREDENTIALS_JSON format - missing web or installed section")
                 return None
 
-            print(f"Creating OAuth flow with {client_type} credentials and redirect URI: {redirect_uri}")
+            logger.debug("Creating OAuth flow with %s credentials and redirect URI: %s", client_type, redirect_uri)
 
             # Create flow with proper client configuration and redirect URI
             return Flow.from_client_config(
@@ -194,5 +272,5 @@ class GoogleAuthService(BaseGoogleService):
             )
 
         except Exception as e:
-            print(f"Error creating auth flow: {str(e)}")
+            logger.error("Error creating auth flow: %s", e)
             return None
@@ -1,10 +1,40 @@
 # Standard library imports
+import asyncio
+import io
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Iterator, Optional, Dict, List
+
+# Third-party imports
+from googleapiclient.http import MediaIoBaseDownload
 
 # Local imports
 from app.services.google.base_google_service import BaseGoogleService
 
+# Chunk size for streamed PDF exports
+_PDF_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Constant batchUpdate fragments shared by the MLA and APA update paths,
+# built once at import time. They are never mutated, only serialized.
+_CREATE_HEADER_REQUEST = {'createHeader': {'type': 'DEFAULT'}}
+
+_ONE_INCH_MARGINS_REQUEST = {
+    'updateDocumentStyle': {
+        'documentStyle': {
+            'marginTop': {'magnitude': 72, 'unit': 'PT'},
+            'marginBottom': {'magnitude': 72, 'unit': 'PT'},
+            'marginLeft': {'magnitude': 72, 'unit': 'PT'},
+            'marginRight': {'magnitude': 72, 'unit': 'PT'}
+        },
+        'fields': 'marginTop,marginBottom,marginLeft,marginRight'
+    }
+}
+
+_TIMES_NEW_ROMAN_12_STYLE = {
+    'fontSize': {'magnitude': 12, 'unit': 'PT'},
+    'weightedFontFamily': {'fontFamily': 'Times New Roman'}
+}
+
+
 class GoogleDocsService(BaseGoogleService):
     """
     Service for interacting with Google Docs.
@@ -22,8 +52,10 @@ class GoogleDocsService(BaseGoogleService):
             Optional[Dict]: Document information or None if an error occurs
         """
         try:
+            # Own transport per call: bulk flows run several creates in
+            # worker threads at once against the shared cached client
             document = self.docs_service.documents().create(
-                body={'title': title}).execute()
+                body={'title': title}).execute(http=self._fresh_authorized_http())
             print(f'Created document with title: {title}')
             return document
         except Exception as e:
@@ -44,24 +76,30 @@ class GoogleDocsService(BaseGoogleService):
             Optional[Dict]: Result of the update or None if an error occurs
         """
         try:
-            # Create header
-            header_requests = [{'createHeader': {'type': 'DEFAULT'}}]
-            self.docs_service.documents().batchUpdate(
-                documentId=document_id,
-                body={'requests': header_requests}
-            ).execute()
+            # Own transport for this call's two round trips; concurrent
+            # formats in worker threads must not share the cached
+            # client's httplib2 connection
+            http = self._fresh_authorized_http()
 
-            # Get header ID
-            doc = self.docs_service.documents().get(
-                documentId=document_id).execute()
-            header_id = doc.get('headers', {}).popitem()[0]
+            # Create header; the reply carries the new header ID, so no
+            # follow-up documents.get round trip is needed
+            header_result = self.docs_service.documents().batchUpdate(
+                documentId=document_id,
+                body={'requests': [_CREATE_HEADER_REQUEST]}
+            ).execute(http=http)
+            header_id = header_result['replies'][0]['createHeader']['headerId']
 
             # Get current date
             current_date = datetime.now().strftime('%d %B %Y')
             last_name = name.split()[-1]
 
+            # Precompute the header indices once instead of re-deriving
+            # them for each request below
+            last_name_len = len(last_name)
+            header_end_index = last_name_len + 3
+
             # Calculate the end index for the main content
-            main_content = f"{name}\n\n{professor}\n\n{class_name}\n\n{current_date}\n\n"
+            main_content = '\n\n'.join((name, professor, class_name, current_date)) + '\n\n'
             main_content_end_index = len(main_content) + 1  # +1 for the initial index
 
             requests = [
@@ -75,19 +113,19 @@ class GoogleDocsService(BaseGoogleService):
                 # Insert page number field
                 {
                     'insertText': {
-                        'location': {'segmentId': header_id, 'index': len(last_name) + 1},
+                        'location': {'segmentId': header_id, 'index': last_name_len + 1},
                         'text': '1'  # This will be automatically updated by Google Docs
                     }
                 },
                 {
                     'insertText': {
-                        'location': {'segmentId': header_id, 'index': len(last_name) + 2},
+                        'location': {'segmentId': header_id, 'index': last_name_len + 2},
                         'text': "\n"
                     }
                 },
                 {
                     'updateParagraphStyle': {
-                        'range': {'segmentId': header_id, 'startIndex': 0, 'endIndex': len(last_name) + 3},
+                        'range': {'segmentId': header_id, 'startIndex': 0, 'endIndex': header_end_index},
                         'paragraphStyle': {'alignment': 'END'},
                         'fields': 'alignment'
                     }
@@ -103,10 +141,7 @@ class GoogleDocsService(BaseGoogleService):
                 {
                     'updateTextStyle': {
                         'range': {'startIndex': 1, 'endIndex': main_content_end_index},
-                        'textStyle': {
-                            'fontSize': {'magnitude': 12, 'unit': 'PT'},
-                            'weightedFontFamily': {'fontFamily': 'Times New Roman'}
-                        },
+                        'textStyle': _TIMES_NEW_ROMAN_12_STYLE,
                         'fields': 'fontSize,weightedFontFamily'
                     }
                 },
@@ -116,12 +151,9 @@ class GoogleDocsService(BaseGoogleService):
                         'range': {
                             'segmentId': header_id,
                             'startIndex': 0,
-                            'endIndex': len(last_name) + 3
-                        },
-                        'textStyle': {
-                            'fontSize': {'magnitude': 12, 'unit': 'PT'},
-                            'weightedFontFamily': {'fontFamily': 'Times New Roman'}
+                            'endIndex': header_end_index
                         },
+                        'textStyle': _TIMES_NEW_ROMAN_12_STYLE,
                         'fields': 'fontSize,weightedFontFamily'
                     }
                 }
@@ -131,7 +163,7 @@ class GoogleDocsService(BaseGoogleService):
             result = self.docs_service.documents().batchUpdate(
                 documentId=document_id,
                 body={'requests': requests}
-            ).execute()
+            ).execute(http=http)
 
             return result
         except Exception as e:
@@ -152,34 +184,20 @@ class GoogleDocsService(BaseGoogleService):
             Optional[Dict]: Result of the update or None if an error occurs
         """
         try:
-            # First, set up 1-inch margins
-            margin_requests = [{
-                'updateDocumentStyle': {
-                    'documentStyle': {
-                        'marginTop': {'magnitude': 72, 'unit': 'PT'},
-                        'marginBottom': {'magnitude': 72, 'unit': 'PT'},
-                        'marginLeft': {'magnitude': 72, 'unit': 'PT'},
-                        'marginRight': {'magnitude': 72, 'unit': 'PT'}
-                    },
-                    'fields': 'marginTop,marginBottom,marginLeft,marginRight'
-                }
-            }]
+            # Own transport for this call's two round trips (see
+            # update_document)
+            http = self._fresh_authorized_http()
 
-            self.docs_service.documents().batchUpdate(
-                documentId=document_id,
-                body={'requests': margin_requests}
-            ).execute()
+            # Set up 1-inch margins and create the header in one
+            # batchUpdate; the createHeader reply carries the new header
+            # ID, so no follow-up documents.get round trip is needed
+            setup_requests = [_ONE_INCH_MARGINS_REQUEST, _CREATE_HEADER_REQUEST]
 
-            # Create header for page number
-            header_requests = [{'createHeader': {'type': 'DEFAULT'}}]
-            self.docs_service.documents().batchUpdate(
+            setup_result = self.docs_service.documents().batchUpdate(
                 documentId=document_id,
-                body={'requests': header_requests}
-            ).execute()
-
-            # Get header ID
-            doc = self.docs_service.documents().get(documentId=document_id).execute()
-            header_id = doc.get('headers', {}).popitem()[0]
+                body={'requests': setup_requests}
+            ).execute(http=http)
+            header_id = setup_result['replies'][1]['createHeader']['headerId']
 
             # Get current date
             current_date = datetime.now().strftime('%B %d, %Y')
@@ -233,10 +251,7 @@ class GoogleDocsService(BaseGoogleService):
                 {
                     'updateTextStyle': {
                         'range': {'startIndex': 1, 'endIndex': len(content) + 1},
-                        'textStyle': {
-                            'fontSize': {'magnitude': 12, 'unit': 'PT'},
-                            'weightedFontFamily': {'fontFamily': 'Times New Roman'}
-                        },
+                        'textStyle': _TIMES_NEW_ROMAN_12_STYLE,
                         'fields': 'fontSize,weightedFontFamily'
                     }
                 },
@@ -248,10 +263,7 @@ class GoogleDocsService(BaseGoogleService):
                             'startIndex': 0,
                             'endIndex': 1
                         },
-                        'textStyle': {
-                            'fontSize': {'magnitude': 12, 'unit': 'PT'},
-                            'weightedFontFamily': {'fontFamily': 'Times New Roman'}
-                        },
+                        'textStyle': _TIMES_NEW_ROMAN_12_STYLE,
                         'fields': 'fontSize,weightedFontFamily'
                     }
                 }
@@ -261,13 +273,54 @@ class GoogleDocsService(BaseGoogleService):
             result = self.docs_service.documents().batchUpdate(
                 documentId=document_id,
                 body={'requests': requests}
-            ).execute()
+            ).execute(http=http)
 
             return result
         except Exception as e:
             print(f"Error updating document: {e}")
             return None
 
+    async def create_formatted_document_async(self, title: str, name: str, professor: str,
+                                              class_name: str, apa: bool = False) -> Optional[Dict]:
+        """
+        Create a document and apply MLA or APA formatting without blocking
+        the event loop.
+
+        The create and format steps are strictly ordered (formatting needs
+        the new document ID), so they run back to back in worker threads.
+        Callers creating several documents can gather multiple of these
+        coroutines to overlap the Google round trips.
+
+        Args:
+            title (str): The title of the document
+            name (str): Student name
+            professor (str): Professor name
+            class_name (str): Class name
+            apa (bool): Apply APA formatting instead of MLA
+
+        Returns:
+            Optional[Dict]: Document information or None if an error occurs
+        """
+        doc = await asyncio.to_thread(self.create_document, title)
+        if not doc:
+            return None
+
+        document_id = doc.get('documentId')
+
+        if apa:
+            result = await asyncio.to_thread(
+                self.update_document_apa, document_id, name, professor, class_name
+            )
+        else:
+            result = await asyncio.to_thread(
+                self.update_document, document_id, name, professor, class_name
+            )
+
+        if not result:
+            return None
+
+        return doc
+
     def export_as_pdf(self, document_id: str) -> Optional[bytes]:
         """
         Export a Google Doc as PDF.
@@ -279,14 +332,60 @@ class GoogleDocsService(BaseGoogleService):
             Optional[bytes]: PDF content or None if an error occurs
         """
         try:
-            # Get the PDF export
-            response = self.drive_service.files().export(
+            # Download the export in chunks instead of one blocking
+            # .execute() call that buffers the whole body at once
+            request = self.drive_service.files().export_media(
                 fileId=document_id,
                 mimeType='application/pdf'
-            ).execute()
+            )
+            buffer = io.BytesIO()
+            downloader = MediaIoBaseDownload(buffer, request, chunksize=_PDF_DOWNLOAD_CHUNK_SIZE)
 
-            return response
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
+
+            return buffer.getvalue()
 
         except Exception as e:
             print(f"Error exporting document as PDF: {str(e)}")
             return None
+
+    def iter_pdf_chunks(self, document_id: str) -> Iterator[bytes]:
+        """
+        Stream a Google Doc's PDF export chunk by chunk.
+
+        Useful with StreamingResponse: memory stays constant for large
+        documents and the first bytes reach the caller as soon as the
+        first chunk arrives instead of after the full download.
+
+        Args:
+            document_id (str): The ID of the document to export
+
+        Yields:
+            bytes: Successive chunks of the PDF content
+
+        Raises:
+            Exception: If the export or a chunk download fails; callers
+                streaming the chunks must not treat a stopped generator
+                as a complete document
+        """
+        try:
+            request = self.drive_service.files().export_media(
+                fileId=document_id,
+                mimeType='application/pdf'
+            )
+            buffer = io.BytesIO()
+            downloader = MediaIoBaseDownload(buffer, request, chunksize=_PDF_DOWNLOAD_CHUNK_SIZE)
+
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        except Exception as e:
+            # Re-raise so consumers (e.g. a StreamingResponse) see the
+            # failure instead of delivering a silently truncated PDF
+            print(f"Error streaming document as PDF: {str(e)}")
+            raise
@@ -1,102 +1,414 @@
 # Standard library imports
+import asyncio
+import time
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Iterable, Optional, Dict, List
 
 # Third-party imports
 from firebase_admin import db
 from googleapiclient.discovery import build
 
 # Local imports
+from app.core.logging import get_logger
 from app.services.google.base_google_service import BaseGoogleService
 
+logger = get_logger(__name__)
+
+# Retries for individual Drive calls; the client applies randomized
+# exponential backoff internally on 429/5xx responses
+_DRIVE_NUM_RETRIES = 5
+
+# MIME type Drive uses for folders
+_FOLDER_MIME = 'application/vnd.google-apps.folder'
+
+# Number of calls per Drive batch request, kept well under the API's
+# 100-call limit so individual batches stay small and retryable
+_DRIVE_BATCH_SIZE = 25
+
+# Translation table for folder-key sanitization: one C-level pass over
+# the name instead of three chained str.replace calls
+_FOLDER_KEY_TABLE = str.maketrans('./ ', '___')
+
+# Current semester name ("Spring 2026" / "Fall 2026") memoized with a
+# TTL; it only changes twice a year, so there is no need to allocate a
+# datetime and rebuild the string on every folder lookup.
+_SEMESTER_NAME_TTL_SECONDS = 3600
+_semester_name_cache = None
+
+# Folder records cached per (user, semester, folder key) with a short
+# TTL — several handlers in one request flow look up the same class's
+# folder IDs, and each miss costs a Firebase round trip. Module-level
+# because the service is instantiated per request.
+_FOLDER_RECORD_TTL_SECONDS = 60
+_folder_record_cache: Dict[tuple, tuple] = {}
+
+# Placeholder written while a root folder is being created, so two
+# concurrent bootstraps cannot both create one. Losers of the claim
+# poll briefly for the claimant to publish the real ID.
+_PARENT_FOLDER_PLACEHOLDER = 'pending'
+_PARENT_FOLDER_WAIT_ATTEMPTS = 5
+_PARENT_FOLDER_WAIT_SECONDS = 0.5
+
+
+def _escape_query_value(value: str) -> str:
+    """
+    Escape a value for interpolation into a Drive q string.
+
+    Backslashes and single quotes would otherwise break (or inject
+    clauses into) the query when they appear in class names.
+
+    Args:
+        value (str): Raw value
+
+    Returns:
+        str: Escaped value safe to wrap in single quotes
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _current_semester_name() -> str:
+    """
+    Get the current semester name, cached per process.
+
+    Returns:
+        str: Semester name, e.g. "Spring 2026" or "Fall 2026"
+    """
+    global _semester_name_cache
+
+    if _semester_name_cache is None or time.monotonic() - _semester_name_cache[0] >= _SEMESTER_NAME_TTL_SECONDS:
+        current_date = datetime.now()
+        semester = 'Spring' if current_date.month < 7 else 'Fall'
+        _semester_name_cache = (time.monotonic(), f"{semester} {current_date.year}")
+
+    return _semester_name_cache[1]
+
+
 class GoogleDriveService(BaseGoogleService):
     """
     Service for interacting with Google Drive.
     Extends BaseGoogleService with file and folder management methods.
     """
 
-    def move_to_folder(self, file_id: str, folder_id: str) -> bool:
+    @staticmethod
+    def _folder_key(name: str) -> str:
+        """
+        Build the Firebase key a folder record is stored under.
+
+        Args:
+            name (str): Folder or class name
+
+        Returns:
+            str: Sanitized key safe for use in a Firebase path
+        """
+        return name.translate(_FOLDER_KEY_TABLE)
+
+    @staticmethod
+    def _folder_body(name: str, parent: Optional[str] = None) -> Dict:
+        """
+        Build the metadata body for a Drive folder create call.
+
+        Args:
+            name (str): Folder name
+            parent (str, optional): Parent folder ID; omitted for roots
+
+        Returns:
+            Dict: Request body for files().create
+        """
+        body = {'name': name, 'mimeType': _FOLDER_MIME}
+        if parent:
+            body['parents'] = [parent]
+        return body
+
+    def _get_folder_record(self, semester_name: str, class_name: str) -> Optional[dict]:
+        """
+        Get a class's folder record from Firebase with a short TTL cache.
+
+        Args:
+            semester_name (str): Semester the record belongs to
+            class_name (str): Name of the class
+
+        Returns:
+            Optional[dict]: The folder record or None if not found
+        """
+        folder_key = self._folder_key(class_name)
+        cache_key = (self.user_id, semester_name, folder_key)
+
+        cached = _folder_record_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _FOLDER_RECORD_TTL_SECONDS:
+            return cached[1]
+
+        record = db.reference(
+            f'users/{self.user_id}/semesters/{semester_name}/folders/{folder_key}'
+        ).get()
+        if record:
+            _folder_record_cache[cache_key] = (time.monotonic(), record)
+        return record
+
+    def move_to_folder(self, file_id: str, folder_id: str,
+                       previous_parents: Optional[str] = None) -> bool:
         """
         Moves a file to specified folder in Google Drive.
 
         Args:
             file_id (str): The ID of the file to move
             folder_id (str): The ID of the destination folder
+            previous_parents (str, optional): Comma-separated IDs of the
+                file's current parents. Callers that already know them
+                (e.g. they just created the file) save the lookup round
+                trip; when omitted they are fetched from Drive.
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            file = self.drive_service.files().get(
-                fileId=file_id,
-                fields='parents'
-            ).execute()
-
-            previous_parents = ",".join(file.get('parents', []))
+            if previous_parents is None:
+                file = self.drive_service.files().get(
+                    fileId=file_id,
+                    fields='parents'
+                ).execute(num_retries=_DRIVE_NUM_RETRIES)
+                previous_parents = ",".join(file.get('parents', []))
+
+            # Only ask for the id — the response is discarded, so there
+            # is no reason to have Drive serialize the parents list back
             self.drive_service.files().update(
                 fileId=file_id,
                 addParents=folder_id,
                 removeParents=previous_parents,
-                fields='id, parents'
-            ).execute()
+                fields='id'
+            ).execute(num_retries=_DRIVE_NUM_RETRIES)
 
             return True
         except Exception as e:
-            print(f'Error moving file: {e}')
+            logger.error("Error moving file: %s", e)
             return False
 
-    def create_class_folders(self, parent_folder_id: str, class_names: list) -> list:
+    def prefetch_folder_records(self) -> Dict[str, str]:
+        """
+        Load every class's folder record for the current semester in one
+        Firebase read.
+
+        Bulk flows that would otherwise call _get_folder_id once per
+        class get all records in a single round trip; the per-record
+        cache is warmed as a side effect so later keyed lookups are
+        local too.
+
+        Returns:
+            Dict[str, str]: Class name -> main folder ID
+        """
+        folder_ids = {}
+        try:
+            semester_name = _current_semester_name()
+            records = db.reference(
+                f'users/{self.user_id}/semesters/{semester_name}/folders'
+            ).get() or {}
+            now = time.monotonic()
+            for folder_key, record in records.items():
+                if not record:
+                    continue
+                _folder_record_cache[(self.user_id, semester_name, folder_key)] = (now, record)
+                name = record.get('name')
+                folder_id = record.get('folder_id')
+                if name and folder_id:
+                    folder_ids[name] = folder_id
+        except Exception as e:
+            logger.error("Error prefetching folder records: %s", e)
+        return folder_ids
+
+    def move_files_to_folders(self, moves: List[tuple]) -> Dict[str, bool]:
+        """
+        Move several files in batched Drive requests.
+
+        Each entry is (file_id, folder_id, previous_parents); pass
+        'root' (or None) for previous_parents when the file was just
+        created without an explicit parent. All moves in a chunk go out
+        in one multipart request instead of one round trip per file.
+
+        Args:
+            moves (List[tuple]): (file_id, folder_id, previous_parents)
+                triples
+
+        Returns:
+            Dict[str, bool]: file ID -> whether its move succeeded
+        """
+        moves = list(moves)
+        results = {}
+
+        def _collect(request_id, response, exception):
+            file_id = moves[int(request_id)][0]
+            if exception is not None:
+                logger.error("Error moving file %s: %s", file_id, exception)
+                results[file_id] = False
+            else:
+                results[file_id] = True
+
+        try:
+            # Own transport: flushes can run while other threads use the
+            # shared cached Drive client
+            http = self._fresh_authorized_http()
+            files = self.drive_service.files
+            new_batch = self.drive_service.new_batch_http_request
+            for start in range(0, len(moves), _DRIVE_BATCH_SIZE):
+                batch = new_batch(callback=_collect)
+                for idx in range(start, min(start + _DRIVE_BATCH_SIZE, len(moves))):
+                    file_id, folder_id, previous_parents = moves[idx]
+                    batch.add(
+                        files().update(
+                            fileId=file_id,
+                            addParents=folder_id,
+                            removeParents=previous_parents or 'root',
+                            fields='id'
+                        ),
+                        request_id=str(idx)
+                    )
+                batch.execute(http=http)
+        except Exception as e:
+            logger.error("Error batch-moving files: %s", e)
+
+        return results
+
+    async def move_to_folder_async(self, file_id: str, folder_id: str,
+                                   previous_parents: Optional[str] = None) -> bool:
+        """
+        Async variant of move_to_folder; the blocking Drive calls run in
+        a worker thread so the event loop stays free.
+
+        Args:
+            file_id (str): The ID of the file to move
+            folder_id (str): The ID of the destination folder
+            previous_parents (str, optional): Comma-separated IDs of the
+                file's current parents, if already known
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.move_to_folder, file_id, folder_id, previous_parents)
+
+    def create_class_folders(self, parent_folder_id: str, class_names: Iterable[str]) -> list:
         """
         Creates folders for each class and a Notes subfolder within each.
 
+        The main-folder creates go through the Drive batch endpoint in
+        one round trip. Notes subfolders are no longer created eagerly —
+        nothing reads them from this node — so they are created on first
+        use via ensure_notes_folder, saving N Drive writes per call.
+
         Args:
             parent_folder_id (str): The ID of the parent folder
-            class_names (list): List of class names
+            class_names (Iterable[str]): Class names; any iterable is
+                accepted and traversed once
 
         Returns:
             list: List of created folder IDs
         """
+        # Materialize once so generators are supported, and key batch
+        # entries by position so duplicate class names cannot collide
+        class_names = list(class_names)
+        main_folder_ids = {}
+
+        def _collect_main(request_id, response, exception):
+            if exception is not None:
+                logger.error("Error creating folder for %s: %s", request_id, exception)
+            else:
+                main_folder_ids[int(request_id)] = response.get('id')
+
+        try:
+            # All main class folders in batched requests; bind the
+            # accessors once outside the loop
+            files = self.drive_service.files
+            new_batch = self.drive_service.new_batch_http_request
+            for start in range(0, len(class_names), _DRIVE_BATCH_SIZE):
+                batch = new_batch(callback=_collect_main)
+                for idx in range(start, min(start + _DRIVE_BATCH_SIZE, len(class_names))):
+                    batch.add(
+                        files().create(
+                            body=self._folder_body(class_names[idx], parent_folder_id),
+                            fields='id'
+                        ),
+                        request_id=str(idx)
+                    )
+                batch.execute()
+        except Exception as e:
+            logger.error("Error creating class folders: %s", e)
+
+        # Save all folder records in one multi-path Firebase write,
+        # preserving the input order in the return value; one timestamp
+        # is shared across the batch
+        created_at = datetime.now().isoformat()
         created_folders = []
-        for class_name in class_names:
+        folder_writes = {}
+        for idx, class_name in enumerate(class_names):
+            folder_id = main_folder_ids.get(idx)
+            if not folder_id:
+                continue
+
+            folder_writes[self._folder_key(class_name)] = {
+                'name': class_name,
+                'main_folder_id': folder_id,
+                'notes_folder_id': None,
+                'created_at': created_at
+            }
+            created_folders.append(folder_id)
+
+        if folder_writes and self.user_id:
             try:
-                # Create main class folder
-                folder_metadata = {
-                    'name': class_name,
-                    'mimeType': 'application/vnd.google-apps.folder',
-                    'parents': [parent_folder_id]
-                }
+                db.reference(f'users/{self.user_id}/folders').update(folder_writes)
+            except Exception as e:
+                logger.error("Error saving folder info: %s", e)
 
-                folder = self.drive_service.files().create(
-                    body=folder_metadata,
-                    fields='id'
-                ).execute()
+        return created_folders
 
-                folder_id = folder.get('id')
+    def ensure_notes_folder(self, class_name: str) -> Optional[str]:
+        """
+        Get the Notes subfolder for a class, creating it on first use.
 
-                # Create Notes subfolder
-                notes_metadata = {
-                    'name': 'Notes',
-                    'mimeType': 'application/vnd.google-apps.folder',
-                    'parents': [folder_id]
-                }
+        Checks the stored folder record first; if no Notes folder has
+        been created yet, creates one under the class's main folder and
+        writes its ID back to Firebase.
 
-                notes_folder = self.drive_service.files().create(
-                    body=notes_metadata,
-                    fields='id'
-                ).execute()
+        Args:
+            class_name (str): Name of the class
 
-                # Save both folders to Firebase
-                self._save_folder_info(class_name, {
-                    'main_folder_id': folder_id,
-                    'notes_folder_id': notes_folder.get('id')
-                })
+        Returns:
+            Optional[str]: Notes folder ID, or None if unavailable
+        """
+        try:
+            if not self.user_id:
+                return None
 
-                created_folders.append(folder_id)
+            folder_ref = db.reference(f'users/{self.user_id}/folders/{self._folder_key(class_name)}')
+            folder_data = folder_ref.get()
+            if not folder_data or not folder_data.get('main_folder_id'):
+                return None
 
-            except Exception as e:
-                print(f'Error creating folder for {class_name}: {e}')
+            notes_folder_id = folder_data.get('notes_folder_id')
+            if notes_folder_id:
+                return notes_folder_id
 
-        return created_folders
+            notes_folder = self.drive_service.files().create(
+                body=self._folder_body('Notes', folder_data['main_folder_id']),
+                fields='id'
+            ).execute(num_retries=_DRIVE_NUM_RETRIES)
+
+            notes_folder_id = notes_folder.get('id')
+            folder_ref.update({'notes_folder_id': notes_folder_id})
+            return notes_folder_id
+        except Exception as e:
+            logger.error("Error ensuring Notes folder for %s: %s", class_name, e)
+            return None
+
+    async def create_class_folders_async(self, parent_folder_id: str, class_names: Iterable[str]) -> list:
+        """
+        Async variant of create_class_folders; the batched Drive round
+        trips run in a worker thread.
+
+        Args:
+            parent_folder_id (str): The ID of the parent folder
+            class_names (list): List of class names
+
+        Returns:
+            list: List of created folder IDs
+        """
+        return await asyncio.to_thread(self.create_class_folders, parent_folder_id, class_names)
 
     def _save_folder_info(self, folder_name: str, folder_data: dict):
         """
@@ -116,7 +428,7 @@ class GoogleDriveService(BaseGoogleService):
             folders_ref = db.reference(f'users/{self.user_id}/folders')
 
             # Create a unique key for the folder
-            folder_key = folder_name.replace('.', '_').replace('/', '_').replace(' ', '_')
+            folder_key = self._folder_key(folder_name)
 
             # Store folder information
             folders_ref.child(folder_key).set({
@@ -129,7 +441,7 @@ class GoogleDriveService(BaseGoogleService):
             return True
 
         except Exception as e:
-            print(f"Error saving folder info: {e}")
+            logger.error("Error saving folder info: %s", e)
             return False
 
     def _get_folder_id(self, class_name: str) -> Optional[str]:
@@ -141,28 +453,30 @@ class GoogleDriveService(BaseGoogleService):
 
         Returns:
             Optional[str]: Folder ID or None if not found
+
+        Raises:
+            PermissionError: If the service has no user ID
         """
-        try:
-            if not self.user_id:
-                return None
+        # Missing auth is a caller bug, not a missing record; raising
+        # here keeps callers from treating it as not-found and retrying
+        if not self.user_id:
+            raise PermissionError("Cannot look up folders without a user ID")
 
+        try:
             # Get current semester
-            current_date = datetime.now()
-            semester = 'Spring' if current_date.month < 7 else 'Fall'
-            semester_name = f"{semester} {current_date.year}"
-
-            # Look up folder in current semester
-            semester_ref = db.reference(f'users/{self.user_id}/semesters/{semester_name}/folders')
-            folders = semester_ref.get()
-
-            if folders:
-                for folder_data in folders.values():
-                    if folder_data.get('name') == class_name:
-                        return folder_data.get('folder_id')
+            semester_name = _current_semester_name()
+
+            # Records are stored under the sanitized class-name key, so
+            # fetch the one record directly (through the short TTL cache)
+            # instead of downloading every folder in the semester
+            folder_data = self._get_folder_record(semester_name, class_name)
+
+            if folder_data:
+                return folder_data.get('folder_id')
             return None
 
         except Exception as e:
-            print(f"Error: Could not find folder ID for {class_name}: {e}")
+            logger.warning("Could not find folder ID for %s: %s", class_name, e)
             return None
 
     def _get_folder_ids(self, class_name: str) -> List[str]:
@@ -174,302 +488,478 @@ class GoogleDriveService(BaseGoogleService):
 
         Returns:
             List[str]: List of folder IDs
+
+        Raises:
+            PermissionError: If the service has no user ID
         """
+        if not self.user_id:
+            raise PermissionError("Cannot look up folders without a user ID")
+
         try:
-            current_date = datetime.now()
-            semester = 'Spring' if current_date.month < 7 else 'Fall'
-            semester_name = f"{semester} {current_date.year}"
+            semester_name = _current_semester_name()
 
-            semester_ref = db.reference(f'users/{self.user_id}/semesters/{semester_name}/folders')
-            folders = semester_ref.get()
+            # Keyed read of the one record instead of the whole subtree
+            folder_data = self._get_folder_record(semester_name, class_name)
 
             folder_ids = []
-            if folders:
-                for folder_data in folders.values():
-                    if folder_data.get('name') == class_name:
-                        if folder_data.get('folder_id'):
-                            folder_ids.append(folder_data.get('folder_id'))
-                        if folder_data.get('notes_folder_id'):
-                            folder_ids.append(folder_data.get('notes_folder_id'))
-                        break
+            if folder_data:
+                if folder_data.get('folder_id'):
+                    folder_ids.append(folder_data.get('folder_id'))
+                if folder_data.get('notes_folder_id'):
+                    folder_ids.append(folder_data.get('notes_folder_id'))
 
             return folder_ids
         except Exception as e:
-            print(f"Error getting folder IDs: {str(e)}")
+            logger.error("Error getting folder IDs: %s", e)
             return []
 
-    def create_semester_folders(self, class_names: list, parent_folder_id: str = None) -> bool:
+    def _find_existing_class_folders(self, semester_folder_id: str, class_names: list) -> tuple:
+        """
+        Resolve existing class folders and their Notes subfolders in two
+        list calls instead of one or two per class.
+
+        The first query ORs all class names under the semester folder;
+        the second ORs the found folder IDs to locate their Notes
+        subfolders.
+
+        Args:
+            semester_folder_id (str): The ID of the semester folder
+            class_names (list): Class names to look for
+
+        Returns:
+            tuple: (class name -> folder ID, folder ID -> Notes folder ID)
+        """
+        class_folder_ids = {}
+        notes_folder_ids = {}
+
+        try:
+            # Bind the collection accessor once; each files() call runs
+            # through the client's resource-building machinery
+            files = self.drive_service.files
+            names_clause = " or ".join(f"name='{_escape_query_value(name)}'" for name in class_names)
+            query = (
+                f"mimeType='{_FOLDER_MIME}' and '{semester_folder_id}' in parents "
+                f"and trashed=false and ({names_clause})"
+            )
+            page_token = None
+            while True:
+                results = files().list(
+                    q=query,
+                    spaces='drive',
+                    fields='nextPageToken, files(id, name)',
+                    pageSize=1000,
+                    pageToken=page_token
+                ).execute(num_retries=_DRIVE_NUM_RETRIES)
+                for folder in results.get('files', []):
+                    class_folder_ids.setdefault(folder['name'], folder['id'])
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+
+            if class_folder_ids:
+                parents_clause = " or ".join(
+                    f"'{folder_id}' in parents" for folder_id in class_folder_ids.values()
+                )
+                query = (
+                    f"mimeType='{_FOLDER_MIME}' and name='Notes' "
+                    f"and trashed=false and ({parents_clause})"
+                )
+                page_token = None
+                while True:
+                    results = files().list(
+                        q=query,
+                        spaces='drive',
+                        fields='nextPageToken, files(id, parents)',
+                        pageSize=1000,
+                        pageToken=page_token
+                    ).execute(num_retries=_DRIVE_NUM_RETRIES)
+                    for folder in results.get('files', []):
+                        for parent in folder.get('parents', []):
+                            notes_folder_ids.setdefault(parent, folder['id'])
+                    page_token = results.get('nextPageToken')
+                    if not page_token:
+                        break
+        except Exception as e:
+            logger.error("Error resolving existing class folders: %s", e)
+
+        return class_folder_ids, notes_folder_ids
+
+    def _get_parent_folder_id(self) -> Optional[str]:
+        """
+        Get the user's root Glide folder ID from Firebase, memoized.
+
+        Reads the single google_parent_folder child directly instead of
+        downloading the whole user record, and caches the value on the
+        instance so repeated operations skip the Firebase round trip.
+
+        Returns:
+            Optional[str]: Root folder ID or None if not set
+        """
+        cached = getattr(self, '_parent_folder_cache', None)
+        if cached:
+            return cached
+
+        parent_folder_id = db.reference(f'users/{self.user_id}/google_parent_folder').get()
+        if parent_folder_id == _PARENT_FOLDER_PLACEHOLDER:
+            # A bootstrap claim is (or was) in flight; never hand the
+            # placeholder out as a real folder ID
+            return None
+        if parent_folder_id:
+            self._parent_folder_cache = parent_folder_id
+        return parent_folder_id
+
+    def _get_or_create_parent_folder(self) -> Optional[str]:
+        """
+        Get the user's root Glide folder ID, creating it if missing.
+
+        The warm path is the memoized keyed read. On a miss the
+        google_parent_folder child is claimed with a Firebase
+        transaction, so concurrent bootstraps agree on one root folder
+        and only the claimant calls Drive.
+
+        Returns:
+            Optional[str]: Root folder ID or None if it could not be
+            created
+        """
+        parent_folder_id = self._get_parent_folder_id()
+        if parent_folder_id:
+            return parent_folder_id
+
+        logger.debug("No google_parent_folder found in user data")
+
+        claimed = []
+
+        def _claim(current):
+            # firebase_admin re-invokes this after ETag conflicts, so the
+            # flag must reflect only the attempt that actually commits
+            claimed.clear()
+            if current:
+                return current
+            claimed.append(True)
+            return _PARENT_FOLDER_PLACEHOLDER
+
+        ref = db.reference(f'users/{self.user_id}/google_parent_folder')
+        result = ref.transaction(_claim)
+
+        if claimed:
+            # We hold the claim: create the folder and store the real ID.
+            # On failure the placeholder must be released, or it would
+            # sit in Firebase forever and block every later bootstrap.
+            logger.info("Creating root folder in Google Drive")
+            try:
+                root_folder = self.drive_service.files().create(
+                    body=self._folder_body('Glide Folders'),
+                    fields='id'
+                ).execute(num_retries=_DRIVE_NUM_RETRIES)
+
+                parent_folder_id = root_folder.get('id')
+                ref.set(parent_folder_id)
+            except Exception:
+                try:
+                    ref.delete()
+                except Exception:
+                    logger.error("Failed to release the root-folder claim for user %s", self.user_id)
+                raise
+
+            self._parent_folder_cache = parent_folder_id
+            logger.info("Saved root folder ID %s to Firebase", parent_folder_id)
+            return parent_folder_id
+
+        if result and result != _PARENT_FOLDER_PLACEHOLDER:
+            # Another writer created the root folder in the meantime
+            self._parent_folder_cache = result
+            return result
+
+        # Another writer holds the claim: wait for it to publish the
+        # real ID rather than creating a duplicate root folder
+        for _ in range(_PARENT_FOLDER_WAIT_ATTEMPTS):
+            time.sleep(_PARENT_FOLDER_WAIT_SECONDS)
+            current = ref.get()
+            if current and current != _PARENT_FOLDER_PLACEHOLDER:
+                self._parent_folder_cache = current
+                return current
+
+        logger.error("Timed out waiting for the root-folder claim for user %s", self.user_id)
+        return None
+
+    def create_semester_folders(self, class_names: Iterable[str], parent_folder_id: str = None) -> bool:
         """
         Creates new folders for a new semester's classes.
 
         Args:
-            class_names (list): List of class names
+            class_names (Iterable[str]): Class names; any iterable is
+                accepted and traversed once
             parent_folder_id (str, optional): Parent folder ID
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            print(f"Creating semester folders for user {self.user_id} with {len(class_names)} classes")
+            class_names = list(class_names)
+            logger.info("Creating semester folders for user %s with %s classes", self.user_id, len(class_names))
 
             if not self.user_id:
-                print("Error: No user ID provided")
+                logger.error("No user ID provided")
                 return False
 
             if not class_names or len(class_names) == 0:
-                print("Error: No class names provided")
+                logger.error("No class names provided")
                 return False
 
             if not self.drive_service:
-                print("Error: Google Drive service not initialized")
+                logger.warning("Google Drive service not initialized")
                 if not self.credentials:
-                    print("Error: No Google credentials available")
+                    logger.error("No Google credentials available")
                     return False
                 try:
                     self.drive_service = build('drive', 'v3', credentials=self.credentials)
-                    print("Successfully initialized Google Drive service")
+                    logger.info("Successfully initialized Google Drive service")
                 except Exception as drive_error:
-                    print(f"Error initializing Google Drive service: {str(drive_error)}")
+                    logger.error("Error initializing Google Drive service: %s", drive_error)
                     return False
 
-            # If no parent folder provided, get the user's root folder from Firebase
+            # If no parent folder provided, get or create the user's
+            # root folder atomically
             if not parent_folder_id:
-                print("No parent folder ID provided, looking up from Firebase")
+                logger.debug("No parent folder ID provided, looking up from Firebase")
                 try:
-                    user_ref = db.reference(f'users/{self.user_id}')
-                    user_data = user_ref.get()
-
-                    if not user_data:
-                        print(f"No user data found in Firebase for user {self.user_id}")
-                        # Create a root folder in Google Drive
-                        print("Creating root folder in Google Drive")
-                        root_folder = self.drive_service.files().create(
-                            body={
-                                'name': 'Glide Folders',
-                                'mimeType': 'application/vnd.google-apps.folder'
-                            },
-                            fields='id'
-                        ).execute()
-
-                        parent_folder_id = root_folder.get('id')
-
-                        # Save the root folder ID to Firebase
-                        if user_ref:
-                            user_ref.update({'google_parent_folder': parent_folder_id})
-                            print(f"Saved root folder ID {parent_folder_id} to Firebase")
-                    elif 'google_parent_folder' not in user_data:
-                        print("No google_parent_folder found in user data")
-                        # Create a root folder in Google Drive
-                        print("Creating root folder in Google Drive")
-                        root_folder = self.drive_service.files().create(
-                            body={
-                                'name': 'Glide Folders',
-                                'mimeType': 'application/vnd.google-apps.folder'
-                            },
-                            fields='id'
-                        ).execute()
-
-                        parent_folder_id = root_folder.get('id')
+                    parent_folder_id = self._get_or_create_parent_folder()
 
-                        # Save the root folder ID to Firebase
-                        user_ref.update({'google_parent_folder': parent_folder_id})
-                        print(f"Saved root folder ID {parent_folder_id} to Firebase")
-                    else:
-                        parent_folder_id = user_data['google_parent_folder']
-                        print(f"Found parent folder ID in Firebase: {parent_folder_id}")
+                    if parent_folder_id:
+                        logger.debug("Using root folder ID from Firebase: %s", parent_folder_id)
                 except Exception as firebase_error:
-                    print(f"Error accessing Firebase: {str(firebase_error)}")
+                    logger.error("Error accessing Firebase: %s", firebase_error)
                     # Create a root folder in Google Drive as fallback
                     try:
-                        print("Creating root folder in Google Drive as fallback")
+                        logger.info("Creating root folder in Google Drive as fallback")
                         root_folder = self.drive_service.files().create(
-                            body={
-                                'name': 'Glide Folders',
-                                'mimeType': 'application/vnd.google-apps.folder'
-                            },
+                            body=self._folder_body('Glide Folders'),
                             fields='id'
-                        ).execute()
+                        ).execute(num_retries=_DRIVE_NUM_RETRIES)
 
                         parent_folder_id = root_folder.get('id')
                     except Exception as drive_error:
-                        print(f"Error creating root folder: {str(drive_error)}")
+                        logger.error("Error creating root folder: %s", drive_error)
                         return False
 
             if not parent_folder_id:
-                print("Error: Could not determine parent folder ID")
+                logger.error("Could not determine parent folder ID")
                 return False
 
-            print(f"Using parent folder ID: {parent_folder_id}")
+            logger.debug("Using parent folder ID: %s", parent_folder_id)
 
             # Create semester folder
-            current_date = datetime.now()
-            semester = 'Spring' if current_date.month < 7 else 'Fall'
-            semester_name = f"{semester} {current_date.year}"
-            print(f"Creating semester folder: {semester_name}")
+            semester_name = _current_semester_name()
+            logger.info("Creating semester folder: %s", semester_name)
 
             # Check if semester folder already exists
             try:
-                query = f"name='{semester_name}' and mimeType='application/vnd.google-apps.folder' and '{parent_folder_id}' in parents and trashed=false"
+                # Pure existence probe: the first hit's ID is all that
+                # is used, so cap the page at one result and only ask
+                # for the id. corpora='user' skips shared-drive lookup.
+                query = f"name='{_escape_query_value(semester_name)}' and mimeType='{_FOLDER_MIME}' and '{parent_folder_id}' in parents and trashed=false"
                 results = self.drive_service.files().list(
                     q=query,
                     spaces='drive',
-                    fields='files(id, name)'
-                ).execute()
+                    corpora='user',
+                    pageSize=1,
+                    fields='files(id)'
+                ).execute(num_retries=_DRIVE_NUM_RETRIES)
 
                 existing_folders = results.get('files', [])
 
                 if existing_folders:
-                    print(f"Found existing semester folder: {existing_folders[0]['name']} with ID: {existing_folders[0]['id']}")
                     semester_folder_id = existing_folders[0]['id']
+                    logger.debug("Found existing semester folder with ID: %s", semester_folder_id)
                 else:
                     # Create new semester folder
-                    semester_metadata = {
-                        'name': semester_name,
-                        'mimeType': 'application/vnd.google-apps.folder',
-                        'parents': [parent_folder_id]
-                    }
-
                     semester_folder = self.drive_service.files().create(
-                        body=semester_metadata,
+                        body=self._folder_body(semester_name, parent_folder_id),
                         fields='id'
-                    ).execute()
+                    ).execute(num_retries=_DRIVE_NUM_RETRIES)
 
                     semester_folder_id = semester_folder.get('id')
-                    print(f"Created new semester folder with ID: {semester_folder_id}")
+                    logger.info("Created new semester folder with ID: %s", semester_folder_id)
             except Exception as folder_error:
-                print(f"Error checking/creating semester folder: {str(folder_error)}")
+                logger.error("Error checking/creating semester folder: %s", folder_error)
                 # Try to create the folder anyway
                 try:
-                    semester_metadata = {
-                        'name': semester_name,
-                        'mimeType': 'application/vnd.google-apps.folder',
-                        'parents': [parent_folder_id]
-                    }
-
                     semester_folder = self.drive_service.files().create(
-                        body=semester_metadata,
+                        body=self._folder_body(semester_name, parent_folder_id),
                         fields='id'
-                    ).execute()
+                    ).execute(num_retries=_DRIVE_NUM_RETRIES)
 
                     semester_folder_id = semester_folder.get('id')
-                    print(f"Created new semester folder with ID: {semester_folder_id}")
+                    logger.info("Created new semester folder with ID: %s", semester_folder_id)
                 except Exception as create_error:
-                    print(f"Error creating semester folder: {str(create_error)}")
+                    logger.error("Error creating semester folder: %s", create_error)
                     return False
 
             if not semester_folder_id:
-                print("Error: Failed to get or create semester folder")
+                logger.error("Failed to get or create semester folder")
                 return False
 
-            # Create folders for each class
-            created_folders = []
-            for class_name in class_names:
-                try:
-                    print(f"Creating folder for class: {class_name}")
-
-                    # Check if class folder already exists
-                    query = f"name='{class_name}' and mimeType='application/vnd.google-apps.folder' and '{semester_folder_id}' in parents and trashed=false"
-                    results = self.drive_service.files().list(
-                        q=query,
-                        spaces='drive',
-                        fields='files(id, name)'
-                    ).execute()
-
-                    existing_folders = results.get('files', [])
-
-                    if existing_folders:
-                        print(f"Found existing class folder: {existing_folders[0]['name']} with ID: {existing_folders[0]['id']}")
-                        folder_id = existing_folders[0]['id']
-
-                        # Check if Notes subfolder exists
-                        query = f"name='Notes' and mimeType='application/vnd.google-apps.folder' and '{folder_id}' in parents and trashed=false"
-                        results = self.drive_service.files().list(
-                            q=query,
-                            spaces='drive',
-                            fields='files(id, name)'
-                        ).execute()
-
-                        existing_notes = results.get('files', [])
-
-                        if existing_notes:
-                            print(f"Found existing Notes folder with ID: {existing_notes[0]['id']}")
-                            notes_folder_id = existing_notes[0]['id']
-                        else:
-                            # Create Notes subfolder
-                            notes_metadata = {
-                                'name': 'Notes',
-                                'mimeType': 'application/vnd.google-apps.folder',
-                                'parents': [folder_id]
-                            }
-
-                            notes_folder = self.drive_service.files().create(
-                                body=notes_metadata,
-                                fields='id'
-                            ).execute()
-
-                            notes_folder_id = notes_folder.get('id')
-                            print(f"Created new Notes folder with ID: {notes_folder_id}")
-                    else:
-                        # Create main class folder
-                        folder_metadata = {
-                            'name': class_name,
-                            'mimeType': 'application/vnd.google-apps.folder',
-                            'parents': [semester_folder_id]
-                        }
-
-                        folder = self.drive_service.files().create(
-                            body=folder_metadata,
-                            fields='id'
-                        ).execute()
-
-                        folder_id = folder.get('id')
-                        print(f"Created new class folder with ID: {folder_id}")
+            # Skip classes already recorded for this semester — creating
+            # them again wastes Drive writes and duplicates folders.
+            # Only the keys matter here, so a shallow read avoids
+            # downloading every record's fields.
+            try:
+                existing_records = db.reference(
+                    f'users/{self.user_id}/semesters/{semester_name}/folders'
+                ).get(shallow=True) or {}
+            except Exception as firebase_error:
+                logger.error("Error reading existing folder records: %s", firebase_error)
+                existing_records = {}
+
+            pending_names = [
+                name for name in class_names
+                if self._folder_key(name) not in existing_records
+            ]
+
+            if len(pending_names) < len(class_names):
+                logger.debug("Skipping %s classes with existing folders", len(class_names) - len(pending_names))
+
+            if not pending_names:
+                logger.debug("All class folders already exist for this semester")
+                return True
 
-                        # Create Notes subfolder
-                        notes_metadata = {
-                            'name': 'Notes',
-                            'mimeType': 'application/vnd.google-apps.folder',
-                            'parents': [folder_id]
-                        }
+            # Resolve every existing class folder and Notes subfolder in
+            # two list calls instead of probing Drive once per class
+            existing_class_folders, existing_notes_folders = self._find_existing_class_folders(
+                semester_folder_id, pending_names
+            )
+
+            # Create whatever is still missing through the Drive batch
+            # endpoint in two waves: main folders, then Notes subfolders
+            # that need the new parent IDs
+            class_folder_ids = {
+                name: existing_class_folders[name]
+                for name in pending_names if name in existing_class_folders
+            }
+            notes_folder_ids = {
+                name: existing_notes_folders[folder_id]
+                for name, folder_id in class_folder_ids.items()
+                if folder_id in existing_notes_folders
+            }
+
+            def _collect_main(request_id, response, exception):
+                name = pending_names[int(request_id)]
+                if exception is not None:
+                    logger.error("Error creating folder for %s: %s", name, exception)
+                else:
+                    class_folder_ids[name] = response.get('id')
+                    logger.debug("Created new class folder with ID: %s", response.get('id'))
 
-                        notes_folder = self.drive_service.files().create(
-                            body=notes_metadata,
+            def _collect_notes(request_id, response, exception):
+                name = pending_names[int(request_id)]
+                if exception is not None:
+                    logger.error("Error creating Notes folder for %s: %s", name, exception)
+                else:
+                    notes_folder_ids[name] = response.get('id')
+
+            # Local bindings for the loops below: each files() call runs
+            # through the client's resource-building machinery, so skip
+            # the repeated attribute lookups per iteration
+            files = self.drive_service.files
+            new_batch = self.drive_service.new_batch_http_request
+
+            missing_main = [idx for idx, name in enumerate(pending_names) if name not in class_folder_ids]
+            for start in range(0, len(missing_main), _DRIVE_BATCH_SIZE):
+                batch = new_batch(callback=_collect_main)
+                for idx in missing_main[start:start + _DRIVE_BATCH_SIZE]:
+                    batch.add(
+                        files().create(
+                            body=self._folder_body(pending_names[idx], semester_folder_id),
                             fields='id'
-                        ).execute()
-
-                        notes_folder_id = notes_folder.get('id')
-                        print(f"Created new Notes folder with ID: {notes_folder_id}")
-
-                    # Save folder info to Firebase with both IDs
-                    saved = self._save_semester_folder_info(
-                        semester_name=semester_name,
-                        class_name=class_name,
-                        folder_data={
-                            'folder_id': folder_id,
-                            'notes_folder_id': notes_folder_id
-                        }
+                        ),
+                        request_id=str(idx)
                     )
+                batch.execute()
+
+            missing_notes = [
+                idx for idx, name in enumerate(pending_names)
+                if name in class_folder_ids and name not in notes_folder_ids
+            ]
+            for start in range(0, len(missing_notes), _DRIVE_BATCH_SIZE):
+                batch = new_batch(callback=_collect_notes)
+                for idx in missing_notes[start:start + _DRIVE_BATCH_SIZE]:
+                    name = pending_names[idx]
+                    batch.add(
+                        files().create(
+                            body=self._folder_body('Notes', class_folder_ids[name]),
+                            fields='id'
+                        ),
+                        request_id=str(idx)
+                    )
+                batch.execute()
 
-                    if saved:
-                        print(f"Saved folder info to Firebase for class: {class_name}")
-                    else:
-                        print(f"Failed to save folder info to Firebase for class: {class_name}")
+            # Queue the records; all classes are committed to Firebase in
+            # one multi-path write below. One timestamp is shared by the
+            # whole batch, so records created together are queryable as
+            # such.
+            created_at = datetime.now().isoformat()
+            created_folders = []
+            folder_writes = {}
+            for class_name in pending_names:
+                folder_id = class_folder_ids.get(class_name)
+                if not folder_id:
+                    continue
 
-                    created_folders.append(folder_id)
+                folder_writes[self._folder_key(class_name)] = {
+                    'name': class_name,
+                    'folder_id': folder_id,
+                    'notes_folder_id': notes_folder_ids.get(class_name),
+                    'created_at': created_at
+                }
 
-                except Exception as e:
-                    print(f'Error creating folder for {class_name}: {str(e)}')
-                    continue
+                created_folders.append(folder_id)
+
+            # Commit all folder records in a single Firebase round trip,
+            # falling back to per-class writes on failure
+            if folder_writes:
+                semester_ref = db.reference(f'users/{self.user_id}/semesters/{semester_name}/folders')
+                try:
+                    semester_ref.update(folder_writes)
+                    logger.info("Saved folder info to Firebase for %s classes", len(folder_writes))
+
+                    # Write the fresh records through to the lookup
+                    # cache so follow-up folder-ID reads are local
+                    now = time.monotonic()
+                    for folder_key, folder_info in folder_writes.items():
+                        _folder_record_cache[(self.user_id, semester_name, folder_key)] = (now, folder_info)
+                except Exception as db_error:
+                    logger.error("Error batch-saving folder info to Firebase: %s", db_error)
+                    for folder_key, folder_info in folder_writes.items():
+                        try:
+                            semester_ref.child(folder_key).set(folder_info)
+                        except Exception as item_error:
+                            logger.error("Failed to save folder info for %s: %s", folder_info.get('name'), item_error)
 
             success = len(created_folders) > 0
-            print(f"Created {len(created_folders)} folders out of {len(class_names)} classes")
+            logger.info("Created %s folders out of %s classes", len(created_folders), len(class_names))
             return success
 
         except Exception as e:
-            print(f"Error creating semester folders: {str(e)}")
+            logger.error("Error creating semester folders: %s", e)
             return False
 
-    def _save_semester_folder_info(self, semester_name: str, class_name: str, folder_data: dict):
+    async def create_semester_folders_async(self, class_names: Iterable[str], parent_folder_id: str = None) -> bool:
+        """
+        Async variant of create_semester_folders for async route
+        handlers; the blocking Drive and Firebase work (including the
+        internal worker pool) runs off the event loop.
+
+        Args:
+            class_names (list): List of class names
+            parent_folder_id (str, optional): Parent folder ID
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.create_semester_folders, class_names, parent_folder_id)
+
+    def _save_semester_folder_info(self, semester_name: str, class_name: str, folder_data: dict,
+                                   created_at: Optional[str] = None):
         """
         Saves semester folder information to Firebase with notes subfolder
 
@@ -477,53 +967,131 @@ class GoogleDriveService(BaseGoogleService):
             semester_name (str): Name of the semester
             class_name (str): Name of the class
             folder_data (dict): Folder data including IDs
+            created_at (str, optional): ISO timestamp to record; callers
+                saving several records can pass one shared value
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
             if not self.user_id:
-                print("Error: No user ID provided")
+                logger.error("No user ID provided")
                 return False
 
             if not semester_name:
-                print("Error: No semester name provided")
+                logger.error("No semester name provided")
                 return False
 
             if not class_name:
-                print("Error: No class name provided")
+                logger.error("No class name provided")
                 return False
 
             if not folder_data or 'folder_id' not in folder_data or 'notes_folder_id' not in folder_data:
-                print("Error: Missing folder data")
+                logger.error("Missing folder data")
                 return False
 
-            print(f"Saving folder info for class {class_name} in semester {semester_name}")
+            logger.debug("Saving folder info for class %s in semester %s", class_name, semester_name)
 
             try:
                 # Create a reference to the semester folders
                 semester_ref = db.reference(f'users/{self.user_id}/semesters/{semester_name}/folders')
 
                 # Create a unique key for the folder
-                folder_key = class_name.replace('.', '_').replace('/', '_').replace(' ', '_')
+                folder_key = self._folder_key(class_name)
 
                 # Store folder information with notes folder ID
                 folder_info = {
                     'name': class_name,
                     'folder_id': folder_data['folder_id'],
                     'notes_folder_id': folder_data['notes_folder_id'],
-                    'created_at': datetime.now().isoformat()
+                    'created_at': created_at or datetime.now().isoformat()
                 }
 
                 semester_ref.child(folder_key).set(folder_info)
-                print(f"Successfully saved folder info to Firebase: {folder_info}")
+                logger.debug("Successfully saved folder info to Firebase: %s", folder_info)
+
+                # Keep the lookup cache warm with the record just written
+                _folder_record_cache[(self.user_id, semester_name, folder_key)] = (time.monotonic(), folder_info)
 
                 return True
             except Exception as db_error:
-                print(f"Error accessing Firebase database: {str(db_error)}")
-                print("Make sure FIREBASE_DATABASE_URL is set correctly in your environment variables")
+                logger.error("Error accessing Firebase database: %s", db_error)
+                logger.error("Make sure FIREBASE_DATABASE_URL is set correctly in your environment variables")
                 return False
 
         except Exception as e:
-            print(f"Error saving semester folder info: {str(e)}")
+            logger.error("Error saving semester folder info: %s", e)
             return False
+
+
+class DriveMoveBatcher:
+    """
+    Coalesces folder-move requests into batched Drive calls.
+
+    Moves submitted within a short linger window are flushed together
+    through GoogleDriveService.move_files_to_folders, so several
+    documents created concurrently share one multipart round trip
+    instead of issuing one update each, while each caller still awaits
+    its own result.
+    """
+
+    # Upper bound per flush, aligned with the Drive batch chunking
+    _MAX_BATCH = 50
+
+    # How long to wait for more moves to arrive before flushing
+    _LINGER_SECONDS = 0.05
+
+    def __init__(self, drive_service_impl):
+        """
+        Args:
+            drive_service_impl (GoogleDriveService): Drive service used
+                for the batched updates
+        """
+        self._drive = drive_service_impl
+        self._queue = asyncio.Queue()
+        self._worker = None
+
+    async def move(self, file_id: str, folder_id: str,
+                   previous_parents: Optional[str] = None) -> bool:
+        """
+        Queue a folder move and wait for its batched result.
+
+        Args:
+            file_id (str): The ID of the file to move
+            folder_id (str): The ID of the destination folder
+            previous_parents (str, optional): Current parent IDs; None
+                means the file sits at the Drive root
+
+        Returns:
+            bool: True if the move succeeded, False otherwise
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((file_id, folder_id, previous_parents, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        """Flush queued moves in linger-window batches until idle."""
+        while not self._queue.empty():
+            # Give concurrent callers a moment to pile on, then take
+            # everything that arrived (up to the batch cap)
+            await asyncio.sleep(self._LINGER_SECONDS)
+            items = []
+            while len(items) < self._MAX_BATCH and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            if not items:
+                continue
+
+            moves = [
+                (file_id, folder_id, previous_parents)
+                for file_id, folder_id, previous_parents, _ in items
+            ]
+            try:
+                results = await asyncio.to_thread(self._drive.move_files_to_folders, moves)
+            except Exception as e:
+                logger.error("Error flushing batched moves: %s", e)
+                results = {}
+            for file_id, _, _, future in items:
+                if not future.done():
+                    future.set_result(results.get(file_id, False))
@@ -1,4 +1,7 @@
 # Standard library imports
+import asyncio
+import functools
+import os
 from datetime import datetime
 from typing import Optional, Dict, List
 
@@ -6,13 +9,45 @@ from typing import Optional, Dict, List
 from firebase_admin import db
 
 # Local imports
+from app.core.logging import get_logger
 from app.services.google.base_google_service import BaseGoogleService
 from app.services.google.google_auth_service import GoogleAuthService
 from app.services.google.google_docs_service import GoogleDocsService
-from app.services.google.google_drive_service import GoogleDriveService
+from app.services.google.google_drive_service import DriveMoveBatcher, GoogleDriveService
 from app.services.google.google_sheets_service import GoogleSheetsService
 from app.services.google.google_slides_service import GoogleSlidesService
 
+logger = get_logger(__name__)
+
+# Concurrent Google API calls allowed per bulk operation; enough to
+# overlap round trips without tripping Google's per-user rate limits
+_API_CONCURRENCY = int(os.getenv('GOOGLE_API_CONCURRENCY', '8'))
+
+# Document URL builder bound once at import; each call is one C-level
+# str.format instead of re-concatenating the constant pieces
+_DOC_URL = 'https://docs.google.com/document/d/{}/edit'.format
+
+# Strong references to fire-and-forget tasks so the loop cannot garbage
+# collect them mid-flight
+_background_tasks = set()
+
+
+def _spawn_background(coro) -> asyncio.Task:
+    """
+    Schedule a coroutine to run after the response is sent.
+
+    Args:
+        coro: Coroutine to run in the background
+
+    Returns:
+        asyncio.Task: The scheduled task
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
 class DocsService(BaseGoogleService):
     """
     Combined service for interacting with Google APIs.
@@ -28,49 +63,47 @@ class DocsService(BaseGoogleService):
         """
         super().__init__(user_id)
 
-        # Initialize specialized services
-        self.auth_service = GoogleAuthService(user_id)
-        self.docs_service_impl = GoogleDocsService(user_id)
-        self.drive_service_impl = GoogleDriveService(user_id)
-        self.sheets_service_impl = GoogleSheetsService(user_id)
-        self.slides_service_impl = GoogleSlidesService(user_id)
+        # Gate for bulk fan-out so a large class list cannot launch an
+        # unbounded number of simultaneous Google calls
+        self._api_semaphore = asyncio.Semaphore(_API_CONCURRENCY)
+
+    # The specialized services are built on first use instead of in
+    # __init__: most endpoints touch only one or two of them, and each
+    # construction loads credentials and API clients. cached_property
+    # keeps the call sites unchanged.
+
+    @functools.cached_property
+    def auth_service(self):
+        """Authentication service, built on first use."""
+        return GoogleAuthService(self.user_id)
+
+    @functools.cached_property
+    def docs_service_impl(self):
+        """Docs service, built on first use."""
+        return GoogleDocsService(self.user_id)
+
+    @functools.cached_property
+    def drive_service_impl(self):
+        """Drive service, built on first use."""
+        return GoogleDriveService(self.user_id)
+
+    @functools.cached_property
+    def move_batcher(self):
+        """Batcher coalescing concurrent folder moves, built on first use."""
+        return DriveMoveBatcher(self.drive_service_impl)
+
+    @functools.cached_property
+    def sheets_service_impl(self):
+        """Sheets service sharing this facade's drive service."""
+        return GoogleSheetsService(self.user_id, drive_service_impl=self.drive_service_impl)
+
+    @functools.cached_property
+    def slides_service_impl(self):
+        """Slides service sharing this facade's drive service."""
+        return GoogleSlidesService(self.user_id, drive_service_impl=self.drive_service_impl)
 
     # ===== Authentication Methods =====
 
-    def initialize_auth_for_registration(self, user_id, auth_code=None):
-        """
-        Initialize Google authentication during user registration
-
-        Args:
-            user_id (str): Firebase user ID
-            auth_code (str, optional): Authorization code from Google OAuth
-
-        Returns:
-            dict: Authentication result
-        """
-        return self.auth_service.initialize_auth_for_registration(user_id, auth_code)
-
-    def get_authorization_url(self):
-        """
-        Get the URL for Google OAuth consent screen
-
-        Returns:
-            str: Authorization URL or None if an error occurs
-        """
-        return self.auth_service.get_authorization_url()
-
-    def handle_auth_callback(self, code):
-        """
-        Handle the OAuth callback and save credentials
-
-        Args:
-            code (str): Authorization code from Google OAuth
-
-        Returns:
-            bool: True if authentication was successful, False otherwise
-        """
-        return self.auth_service.handle_auth_callback(code)
-
     def has_valid_credentials(self):
         """
         Check if the user has valid Google credentials
@@ -89,162 +122,266 @@ class DocsService(BaseGoogleService):
         """
         return self.auth_service.delete_token()
 
-    # ===== Document Creation and Management Methods =====
+    # ===== Delegated Methods =====
+
+    # Pure pass-throughs are resolved on demand instead of wrapped in
+    # one-line delegate methods: attribute access hands back the
+    # implementation's bound method directly, so every call skips the
+    # extra wrapper frame, and touching a name only builds the service
+    # it belongs to. has_valid_credentials and delete_token stay as
+    # real methods above because the base class also defines them.
+    _DELEGATES = {
+        'initialize_auth_for_registration': 'auth_service',
+        'initialize_auth_for_registration_async': 'auth_service',
+        'get_authorization_url': 'auth_service',
+        'handle_auth_callback': 'auth_service',
+        'handle_auth_callback_async': 'auth_service',
+        'create_document': 'docs_service_impl',
+        'update_document': 'docs_service_impl',
+        'update_document_apa': 'docs_service_impl',
+        'export_as_pdf': 'docs_service_impl',
+        'iter_pdf_chunks': 'docs_service_impl',
+        'move_to_folder': 'drive_service_impl',
+        'move_to_folder_async': 'drive_service_impl',
+        'create_class_folders': 'drive_service_impl',
+        'create_class_folders_async': 'drive_service_impl',
+        'create_semester_folders': 'drive_service_impl',
+        'create_semester_folders_async': 'drive_service_impl',
+        '_get_folder_id': 'drive_service_impl',
+        '_get_folder_ids': 'drive_service_impl',
+        'create_spreadsheet': 'sheets_service_impl',
+        'create_spreadsheet_async': 'sheets_service_impl',
+        'create_presentation': 'slides_service_impl',
+        'create_presentation_async': 'slides_service_impl',
+    }
+
+    def __getattr__(self, name):
+        impl_attr = DocsService._DELEGATES.get(name)
+        if impl_attr is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        method = getattr(getattr(self, impl_attr), name)
+        # Cache the bound method on the instance so later lookups do not
+        # re-enter __getattr__
+        setattr(self, name, method)
+        return method
 
-    def create_document(self, title: str) -> Optional[Dict]:
-        """
-        Creates a new Google Doc with the given title.
+    # ===== Document Format Methods =====
 
-        Args:
-            title (str): The title of the document
+    # Formatter method name per document format; dispatch target for the
+    # shared creation path below
+    _FORMATTERS = {'mla': 'update_document', 'apa': 'update_document_apa'}
 
-        Returns:
-            Optional[Dict]: Document information or None if an error occurs
+    def _create_formatted_document(self, fmt: str, assignment_data: dict) -> Optional[Dict]:
         """
-        return self.docs_service_impl.create_document(title)
+        Shared MLA/APA creation path: create, format, move, record.
 
-    def update_document(self, document_id: str, name: str, professor: str, class_name: str) -> Optional[Dict]:
-        """
-        Updates a Google Doc with MLA formatting.
+        The two formats only differ in which batchUpdate method applies
+        the formatting and in the shape of the returned info, so one
+        path serves both instead of two near-identical copies.
 
         Args:
-            document_id (str): The ID of the document to update
-            name (str): Student name
-            professor (str): Professor name
-            class_name (str): Class name
+            fmt (str): 'mla' or 'apa'
+            assignment_data (dict): Assignment data
 
         Returns:
-            Optional[Dict]: Result of the update or None if an error occurs
-        """
-        return self.docs_service_impl.update_document(document_id, name, professor, class_name)
-
-    def update_document_apa(self, document_id: str, name: str, professor: str, class_name: str) -> Optional[Dict]:
+            Optional[Dict]: Document information or None if an error occurs
         """
-        Updates a Google Doc with APA formatting.
+        try:
+            title = assignment_data['name']
+            class_name = assignment_data.get('course_name', '')
 
-        Args:
-            document_id (str): The ID of the document to update
-            name (str): Student name
-            professor (str): Professor name
-            class_name (str): Class name
+            # Create base document
+            doc = self.create_document(title)
+            if not doc:
+                return None
 
-        Returns:
-            Optional[Dict]: Result of the update or None if an error occurs
-        """
-        return self.docs_service_impl.update_document_apa(document_id, name, professor, class_name)
+            document_id = doc.get('documentId')
 
-    def export_as_pdf(self, document_id: str) -> Optional[bytes]:
-        """
-        Export a Google Doc as PDF.
+            # Apply the requested formatting
+            formatter = getattr(self.docs_service_impl, self._FORMATTERS[fmt])
+            result = formatter(
+                document_id=document_id,
+                name=assignment_data.get('student_name', ''),
+                professor=assignment_data.get('professor', ''),
+                class_name=class_name
+            )
+            if not result:
+                return None
 
-        Args:
-            document_id (str): The ID of the document to export
+            # Move document to correct class folder
+            folder_id = self._get_folder_id(class_name)
+            if folder_id:
+                self.move_to_folder(document_id, folder_id)
 
-        Returns:
-            Optional[bytes]: PDF content or None if an error occurs
-        """
-        return self.docs_service_impl.export_as_pdf(document_id)
+            url = _DOC_URL(document_id)
+            if fmt == 'mla':
+                return {
+                    'id': document_id,
+                    'url': url
+                }
 
-    # ===== File and Folder Management Methods =====
+            doc_info = {
+                'document_id': document_id,
+                'assignment_name': title,
+                'course_name': class_name,
+                'url': url,
+                'format': 'APA'
+            }
 
-    def move_to_folder(self, file_id: str, folder_id: str) -> bool:
-        """
-        Moves a file to specified folder in Google Drive.
+            # Store in Firebase if course_id and assignment_id are provided
+            if 'course_id' in assignment_data and 'assignment_id' in assignment_data:
+                self.store_document_info(
+                    assignment_data['course_id'],
+                    assignment_data['assignment_id'],
+                    doc_info
+                )
 
-        Args:
-            file_id (str): The ID of the file to move
-            folder_id (str): The ID of the destination folder
+            return doc_info
 
-        Returns:
-            bool: True if successful, False otherwise
-        """
-        return self.drive_service_impl.move_to_folder(file_id, folder_id)
+        except Exception as e:
+            logger.error("Error creating %s document: %s", fmt.upper(), e)
+            return None
 
-    def create_class_folders(self, parent_folder_id: str, class_names: list) -> list:
+    def create_mla_document(self, assignment_data: dict) -> Optional[Dict]:
         """
-        Creates folders for each class and a Notes subfolder within each.
+        Creates an MLA formatted document for the assignment.
 
         Args:
-            parent_folder_id (str): The ID of the parent folder
-            class_names (list): List of class names
+            assignment_data (dict): Assignment data
 
         Returns:
-            list: List of created folder IDs
+            Optional[Dict]: Document information or None if an error occurs
         """
-        return self.drive_service_impl.create_class_folders(parent_folder_id, class_names)
+        return self._create_formatted_document('mla', assignment_data)
 
-    def create_semester_folders(self, class_names: list, parent_folder_id: str = None) -> bool:
+    def create_apa_document(self, assignment_data: dict) -> Optional[Dict]:
         """
-        Creates new folders for a new semester's classes.
+        Creates an APA formatted document for the assignment.
 
         Args:
-            class_names (list): List of class names
-            parent_folder_id (str, optional): Parent folder ID
+            assignment_data (dict): Assignment data
 
         Returns:
-            bool: True if successful, False otherwise
+            Optional[Dict]: Document information or None if an error occurs
         """
-        return self.drive_service_impl.create_semester_folders(class_names, parent_folder_id)
+        return self._create_formatted_document('apa', assignment_data)
 
-    # ===== Spreadsheet Methods =====
-
-    def create_spreadsheet(self, assignment_data: dict) -> Optional[Dict]:
+    async def _create_formatted_document_async(self, fmt: str, assignment_data: dict) -> Optional[Dict]:
         """
-        Creates a simple Google Sheets document for the assignment.
+        Async shared MLA/APA creation path with overlapped round trips.
+
+        The document create and the Firebase folder lookup are
+        independent, so they run concurrently; once the document ID is
+        known, the formatting batchUpdate and the folder move are also
+        independent of each other and are gathered as well. Wall-clock
+        drops from four sequential round trips to roughly two.
 
         Args:
-            assignment_data (dict): Assignment data including name and course
+            fmt (str): 'mla' or 'apa'
+            assignment_data (dict): Assignment data
 
         Returns:
-            Optional[Dict]: Spreadsheet information or None if an error occurs
+            Optional[Dict]: Document information or None if an error occurs
         """
-        return self.sheets_service_impl.create_spreadsheet(assignment_data)
+        try:
+            title = assignment_data['name']
+            class_name = assignment_data.get('course_name', '')
 
-    # ===== Presentation Methods =====
+            doc, folder_id = await asyncio.gather(
+                asyncio.to_thread(self.create_document, title),
+                asyncio.to_thread(self._get_folder_id, class_name)
+            )
+            if not doc:
+                return None
 
-    def create_presentation(self, assignment_data: dict) -> Optional[Dict]:
-        """
-        Creates a simple Google Slides presentation for the assignment.
+            document_id = doc.get('documentId')
+            url = _DOC_URL(document_id)
+
+            doc_info = None
+            if fmt == 'apa':
+                doc_info = {
+                    'document_id': document_id,
+                    'assignment_name': title,
+                    'course_name': class_name,
+                    'url': url,
+                    'format': 'APA'
+                }
+
+            # Only the formatting batchUpdate gates the response — the
+            # caller just needs the ID and URL. The folder move and the
+            # Firebase record write are scheduled as background tasks
+            # and run after the response is sent; failures are logged
+            # rather than surfaced.
+            formatter = getattr(self.docs_service_impl, self._FORMATTERS[fmt])
+            result = await asyncio.to_thread(
+                formatter,
+                document_id=document_id,
+                name=assignment_data.get('student_name', ''),
+                professor=assignment_data.get('professor', ''),
+                class_name=class_name
+            )
+            if not result:
+                return None
 
-        Args:
-            assignment_data (dict): Assignment data including name and course
+            if folder_id:
+                # The batcher coalesces moves from concurrently created
+                # documents into one Drive batch request; the document
+                # was just created at the Drive root
+                _spawn_background(self._move_and_log(document_id, folder_id))
+            if doc_info and 'course_id' in assignment_data and 'assignment_id' in assignment_data:
+                _spawn_background(asyncio.to_thread(
+                    self.store_document_info,
+                    assignment_data['course_id'],
+                    assignment_data['assignment_id'],
+                    doc_info
+                ))
 
-        Returns:
-            Optional[Dict]: Presentation information or None if an error occurs
-        """
-        return self.slides_service_impl.create_presentation(assignment_data)
+            if fmt == 'mla':
+                return {
+                    'id': document_id,
+                    'url': url
+                }
+
+            return doc_info
 
-    # ===== Helper Methods =====
+        except Exception as e:
+            logger.error("Error creating %s document: %s", fmt.upper(), e)
+            return None
 
-    def _get_folder_id(self, class_name: str) -> Optional[str]:
+    async def _move_and_log(self, document_id: str, folder_id: str):
         """
-        Get folder ID from Firebase for given class
+        Background folder move; logs failure instead of raising.
 
         Args:
-            class_name (str): Name of the class
-
-        Returns:
-            Optional[str]: Folder ID or None if not found
+            document_id (str): The ID of the document to move
+            folder_id (str): The ID of the destination folder
         """
-        return self.drive_service_impl._get_folder_id(class_name)
+        try:
+            moved = await self.move_batcher.move(document_id, folder_id)
+            if not moved:
+                logger.error("Background move of %s to folder %s failed", document_id, folder_id)
+        except Exception as e:
+            logger.error("Error in background move of %s: %s", document_id, e)
 
-    def _get_folder_ids(self, class_name: str) -> List[str]:
+    async def create_mla_document_async(self, assignment_data: dict) -> Optional[Dict]:
         """
-        Helper method to get folder IDs from Firebase
+        Async variant of create_mla_document that overlaps the Google
+        round trips.
 
         Args:
-            class_name (str): Name of the class
+            assignment_data (dict): Assignment data
 
         Returns:
-            List[str]: List of folder IDs
+            Optional[Dict]: Document information or None if an error occurs
         """
-        return self.drive_service_impl._get_folder_ids(class_name)
+        return await self._create_formatted_document_async('mla', assignment_data)
 
-    # ===== Document Format Methods =====
-
-    def create_mla_document(self, assignment_data: dict) -> Optional[Dict]:
+    async def create_apa_document_async(self, assignment_data: dict) -> Optional[Dict]:
         """
-        Creates an MLA formatted document for the assignment.
+        Async variant of create_apa_document that overlaps the Google
+        round trips.
 
         Args:
             assignment_data (dict): Assignment data
@@ -252,102 +389,77 @@ class DocsService(BaseGoogleService):
         Returns:
             Optional[Dict]: Document information or None if an error occurs
         """
-        try:
-            # Create base document
-            doc = self.create_document(assignment_data['name'])
-            if not doc:
-                return None
-
-            document_id = doc.get('documentId')
-
-            # Get user info from assignment data
-            student_name = assignment_data.get('student_name', '')
-            professor = assignment_data.get('professor', '')
-            class_name = assignment_data.get('course_name', '')
-
-            # Apply MLA formatting using existing update_document method
-            result = self.update_document(
-                document_id=document_id,
-                name=student_name,
-                professor=professor,
-                class_name=class_name
-            )
-
-            if not result:
-                return None
+        return await self._create_formatted_document_async('apa', assignment_data)
 
-            # Move document to correct class folder
-            folder_id = self._get_folder_id(class_name)
-            if folder_id:
-                self.move_to_folder(document_id, folder_id)
+    async def _bounded(self, awaitable):
+        """
+        Run an awaitable under the per-instance API concurrency gate.
 
-            return {
-                'id': document_id,
-                'url': f'https://docs.google.com/document/d/{document_id}/edit'
-            }
+        Args:
+            awaitable: Coroutine issuing one or more Google API calls
 
-        except Exception as e:
-            print(f"Error creating MLA document: {e}")
-            return None
+        Returns:
+            The awaitable's result
+        """
+        async with self._api_semaphore:
+            return await awaitable
 
-    def create_apa_document(self, assignment_data: dict) -> Optional[Dict]:
+    async def bulk_create_assignments(self, assignment_list: List[dict]) -> List[Optional[Dict]]:
         """
-        Creates an APA formatted document for the assignment.
+        Create documents for several assignments with batched Google
+        traffic.
+
+        The document creates run concurrently, the class folder IDs are
+        resolved once per course, and every folder move goes through the
+        Drive batch endpoint in one multipart request instead of one
+        round trip per document. Entries may set 'format' to 'APA' for
+        APA formatting; the default is MLA.
 
         Args:
-            assignment_data (dict): Assignment data
+            assignment_list (List[dict]): Assignment data dicts
 
         Returns:
-            Optional[Dict]: Document information or None if an error occurs
+            List[Optional[Dict]]: Document info per assignment, aligned
+                with the input; None where creation failed
         """
         try:
-            # Create base document
-            doc = self.create_document(assignment_data['name'])
-            if not doc:
-                return None
-
-            document_id = doc.get('documentId')
-
-            # Get user info from assignment data
-            student_name = assignment_data.get('student_name', '')
-            professor = assignment_data.get('professor', '')
-            class_name = assignment_data.get('course_name', '')
-
-            # Apply APA formatting using existing update_document_apa method
-            result = self.update_document_apa(
-                document_id=document_id,
-                name=student_name,
-                professor=professor,
-                class_name=class_name
+            docs = await asyncio.gather(*(
+                self._bounded(self.docs_service_impl.create_formatted_document_async(
+                    assignment['name'],
+                    assignment.get('student_name', ''),
+                    assignment.get('professor', ''),
+                    assignment.get('course_name', ''),
+                    apa=assignment.get('format', 'MLA').upper() == 'APA'
+                ))
+                for assignment in assignment_list
+            ))
+
+            # All folder IDs in one Firebase read instead of one
+            # lookup per distinct course
+            folder_ids = await asyncio.to_thread(
+                self.drive_service_impl.prefetch_folder_records
             )
 
-            if not result:
-                return None
-
-            # Move document to correct class folder
-            folder_id = self._get_folder_id(class_name)
-            if folder_id:
-                self.move_to_folder(document_id, folder_id)
-
-            # Create document info
-            doc_info = {
-                'document_id': document_id,
-                'assignment_name': assignment_data['name'],
-                'course_name': class_name,
-                'url': f'https://docs.google.com/document/d/{document_id}/edit',
-                'format': 'APA'
-            }
-
-            # Store in Firebase if course_id and assignment_id are provided
-            if 'course_id' in assignment_data and 'assignment_id' in assignment_data:
-                self.store_document_info(
-                    assignment_data['course_id'],
-                    assignment_data['assignment_id'],
-                    doc_info
-                )
-
-            return doc_info
+            # All folder moves in batched Drive requests; the documents
+            # were just created at the Drive root
+            moves = []
+            for assignment, doc in zip(assignment_list, docs):
+                if not doc:
+                    continue
+                folder_id = folder_ids.get(assignment.get('course_name', ''))
+                if folder_id:
+                    moves.append((doc.get('documentId'), folder_id, 'root'))
+            if moves:
+                await asyncio.to_thread(self.drive_service_impl.move_files_to_folders, moves)
+
+            return [
+                {
+                    'id': doc.get('documentId'),
+                    'url': _DOC_URL(doc.get('documentId'))
+                } if doc else None
+                for doc in docs
+            ]
 
         except Exception as e:
-            print(f"Error creating APA document: {e}")
-            return None
+            logger.error("Error bulk-creating assignments: %s", e)
+            return [None] * len(assignment_list)
@@ -1,11 +1,13 @@
 # Standard library imports
+import asyncio
 from typing import Optional, Dict
 
-# Google API imports
-from googleapiclient.discovery import build
-
 # Local imports
 from app.services.google.base_google_service import BaseGoogleService
+from app.services.google.google_drive_service import GoogleDriveService
+
+# Spreadsheet URL builder bound once at import
+_SPREADSHEET_URL = 'https://docs.google.com/spreadsheets/d/{}/edit'.format
 
 class GoogleSheetsService(BaseGoogleService):
     """
@@ -13,6 +15,31 @@ class GoogleSheetsService(BaseGoogleService):
     Extends BaseGoogleService with spreadsheet-specific methods.
     """
 
+    def __init__(self, user_id=None, drive_service_impl=None):
+        """
+        Initialize the service, optionally sharing a drive service.
+
+        Args:
+            user_id (str, optional): Firebase user ID
+            drive_service_impl (GoogleDriveService, optional): Shared
+                drive service; when omitted one is created lazily on
+                first use. Injecting one avoids re-loading credentials
+                and rebuilding the Drive client per call.
+        """
+        super().__init__(user_id)
+        self.drive_service_impl = drive_service_impl
+
+    def _get_drive_service_impl(self):
+        """
+        Get the shared GoogleDriveService, creating it on first use.
+
+        Returns:
+            GoogleDriveService: Drive service bound to this user
+        """
+        if self.drive_service_impl is None:
+            self.drive_service_impl = GoogleDriveService(self.user_id)
+        return self.drive_service_impl
+
     def create_spreadsheet(self, assignment_data: dict) -> Optional[Dict]:
         """
         Creates a simple Google Sheets document for the assignment.
@@ -24,11 +51,15 @@ class GoogleSheetsService(BaseGoogleService):
             Optional[Dict]: Spreadsheet information or None if an error occurs
         """
         try:
-            # Make sure sheets service is initialized
+            # Make sure sheets service is initialized; _initialize_services
+            # serves the per-user cached clients instead of re-running a
+            # discovery build here
             if not self.sheets_service:
                 if not self.credentials:
                     return None
-                self.sheets_service = build('sheets', 'v4', credentials=self.credentials)
+                self._initialize_services()
+                if not self.sheets_service:
+                    return None
 
             # Create spreadsheet with assignment name
             spreadsheet_body = {
@@ -53,13 +84,27 @@ class GoogleSheetsService(BaseGoogleService):
                 'document_id': spreadsheet_id,
                 'assignment_name': assignment_data['name'],
                 'course_name': assignment_data.get('course_name', ''),
-                'url': f'https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit'
+                'url': _SPREADSHEET_URL(spreadsheet_id)
             }
 
         except Exception as e:
             print(f"Error creating spreadsheet: {e}")
             return None
 
+
+    async def create_spreadsheet_async(self, assignment_data: dict) -> Optional[Dict]:
+        """
+        Async variant of create_spreadsheet; the blocking Google calls run
+        in a worker thread so the event loop stays free.
+
+        Args:
+            assignment_data (dict): Assignment data including name and course
+
+        Returns:
+            Optional[Dict]: Spreadsheet information or None if an error occurs
+        """
+        return await asyncio.to_thread(self.create_spreadsheet, assignment_data)
+
     def _get_folder_id(self, class_name: str) -> Optional[str]:
         """
         Get folder ID from Firebase for given class
@@ -70,12 +115,9 @@ class GoogleSheetsService(BaseGoogleService):
         Returns:
             Optional[str]: Folder ID or None if not found
         """
-        # This is a duplicate of the method in GoogleDriveService
-        # In a real implementation, you might want to use dependency injection
-        # or create a common utility class for these shared methods
-        from app.services.google.google_drive_service import GoogleDriveService
-        drive_service = GoogleDriveService(self.user_id)
-        return drive_service._get_folder_id(class_name)
+        # Delegates to the shared GoogleDriveService instead of
+        # constructing a fresh one (and its credentials + client) per call
+        return self._get_drive_service_impl()._get_folder_id(class_name)
 
     def move_to_folder(self, file_id: str, folder_id: str) -> bool:
         """
@@ -88,7 +130,5 @@ class GoogleSheetsService(BaseGoogleService):
         Returns:
             bool: True if successful, False otherwise
         """
-        # This is a duplicate of the method in GoogleDriveService
-        from app.services.google.google_drive_service import GoogleDriveService
-        drive_service = GoogleDriveService(self.user_id)
-        return drive_service.move_to_folder(file_id, folder_id)
+        # Delegates to the shared GoogleDriveService
+        return self._get_drive_service_impl().move_to_folder(file_id, folder_id)
@@ -1,11 +1,13 @@
 # Standard library imports
+import asyncio
 from typing import Optional, Dict
 
-# Google API imports
-from googleapiclient.discovery import build
-
 # Local imports
 from app.services.google.base_google_service import BaseGoogleService
+from app.services.google.google_drive_service import GoogleDriveService
+
+# Presentation URL builder bound once at import
+_PRESENTATION_URL = 'https://docs.google.com/presentation/d/{}/edit'.format
 
 class GoogleSlidesService(BaseGoogleService):
     """
@@ -13,6 +15,31 @@ class GoogleSlidesService(BaseGoogleService):
     Extends BaseGoogleService with presentation-specific methods.
     """
 
+    def __init__(self, user_id=None, drive_service_impl=None):
+        """
+        Initialize the service, optionally sharing a drive service.
+
+        Args:
+            user_id (str, optional): Firebase user ID
+            drive_service_impl (GoogleDriveService, optional): Shared
+                drive service; when omitted one is created lazily on
+                first use. Injecting one avoids re-loading credentials
+                and rebuilding the Drive client per call.
+        """
+        super().__init__(user_id)
+        self.drive_service_impl = drive_service_impl
+
+    def _get_drive_service_impl(self):
+        """
+        Get the shared GoogleDriveService, creating it on first use.
+
+        Returns:
+            GoogleDriveService: Drive service bound to this user
+        """
+        if self.drive_service_impl is None:
+            self.drive_service_impl = GoogleDriveService(self.user_id)
+        return self.drive_service_impl
+
     def create_presentation(self, assignment_data: dict) -> Optional[Dict]:
         """
         Creates a simple Google Slides presentation for the assignment.
@@ -24,11 +51,15 @@ class GoogleSlidesService(BaseGoogleService):
             Optional[Dict]: Presentation information or None if an error occurs
         """
         try:
-            # Make sure slides service is initialized
+            # Make sure slides service is initialized; _initialize_services
+            # serves the per-user cached clients instead of re-running a
+            # discovery build here
             if not self.slides_service:
                 if not self.credentials:
                     return None
-                self.slides_service = build('slides', 'v1', credentials=self.credentials)
+                self._initialize_services()
+                if not self.slides_service:
+                    return None
 
             # Create presentation with assignment name
             presentation = self.slides_service.presentations().create(
@@ -46,13 +77,27 @@ class GoogleSlidesService(BaseGoogleService):
                 'document_id': presentation_id,
                 'assignment_name': assignment_data['name'],
                 'course_name': assignment_data.get('course_name', ''),
-                'url': f'https://docs.google.com/presentation/d/{presentation_id}/edit'
+                'url': _PRESENTATION_URL(presentation_id)
             }
 
         except Exception as e:
             print(f"Error creating presentation: {e}")
             return None
 
+
+    async def create_presentation_async(self, assignment_data: dict) -> Optional[Dict]:
+        """
+        Async variant of create_presentation; the blocking Google calls run
+        in a worker thread so the event loop stays free.
+
+        Args:
+            assignment_data (dict): Assignment data including name and course
+
+        Returns:
+            Optional[Dict]: Presentation information or None if an error occurs
+        """
+        return await asyncio.to_thread(self.create_presentation, assignment_data)
+
     def _get_folder_id(self, class_name: str) -> Optional[str]:
         """
         Get folder ID from Firebase for given class
@@ -63,12 +108,9 @@ class GoogleSlidesService(BaseGoogleService):
         Returns:
             Optional[str]: Folder ID or None if not found
         """
-        # This is a duplicate of the method in GoogleDriveService
-        # In a real implementation, you might want to use dependency injection
-        # or create a common utility class for these shared methods
-        from app.services.google.google_drive_service import GoogleDriveService
-        drive_service = GoogleDriveService(self.user_id)
-        return drive_service._get_folder_id(class_name)
+        # Delegates to the shared GoogleDriveService instead of
+        # constructing a fresh one (and its credentials + client) per call
+        return self._get_drive_service_impl()._get_folder_id(class_name)
 
     def move_to_folder(self, file_id: str, folder_id: str) -> bool:
         """
@@ -81,7 +123,5 @@ class GoogleSlidesService(BaseGoogleService):
         Returns:
             bool: True if successful, False otherwise
         """
-        # This is a duplicate of the method in GoogleDriveService
-        from app.services.google.google_drive_service import GoogleDriveService
-        drive_service = GoogleDriveService(self.user_id)
-        return drive_service.move_to_folder(file_id, folder_id)
+        # Delegates to the shared GoogleDriveService
+        return self._get_drive_service_impl().move_to_folder(file_id, folder_id)
@@ -23,8 +23,12 @@ class CanvasTool:
             Formatted string with course information
         """
         try:
-            # Get courses from Firestore first, then fall back to Canvas API if needed
-            courses = await self.canvas_service.get_courses_from_firestore(user_id, "current")
+            # Get courses from Firestore first, then fall back to Canvas API if needed.
+            # Only project the fields the chat response actually formats.
+            courses = await self.canvas_service.get_courses_from_firestore(
+                user_id, "current",
+                fields=['name', 'course_code', 'term', 'teachers']
+            )
 
             if not courses:
                 return "I couldn't find any Canvas courses. You might need to set up your Canvas credentials in Glide first."
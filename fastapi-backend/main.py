@@ -1,3 +1,6 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
@@ -36,6 +39,22 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.on_event("startup")
+async def configure_default_executor():
+    """
+    Bound the default thread pool used by asyncio.to_thread.
+
+    The blocking Google/Firestore client calls run in worker threads via
+    asyncio.to_thread; sizing the pool explicitly keeps concurrent
+    requests from spawning unbounded threads while still letting their
+    network round trips overlap.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=32, thread_name_prefix="blocking-io")
+    )
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():